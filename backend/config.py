@@ -115,6 +115,9 @@ CORS_ORIGINS = os.getenv("CORS_ORIGINS", "*").split(",")
 ENABLE_CACHING = os.getenv("ENABLE_CACHING", "false").lower() == "true"
 ENABLE_RATE_LIMITING = os.getenv("ENABLE_RATE_LIMITING", "false").lower() == "true"
 
+# Entries kept in each orchestrator (and chat reply) cache when caching is enabled
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "512"))
+
 # ============================================================================
 # Validation
 # ============================================================================
@@ -9,13 +9,16 @@ Version: 2.0.0
 
 import logging
 import requests
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 from dataclasses import dataclass
 import base64
 import re
 
 logger = logging.getLogger(__name__)
 
+ROUTER_BASE_URL = "https://router.huggingface.co"
+CHAT_COMPLETIONS_URL = f"{ROUTER_BASE_URL}/v1/chat/completions"
+
 
 # Custom Exceptions for backward compatibility
 class HFAPIError(Exception):
@@ -91,7 +94,7 @@ class HuggingFaceClient:
     
     def query_vision_model(
         self,
-        image: bytes,
+        image: Union[bytes, str],
         prompt: str,
         model_id: Optional[str] = None,
         parameters: Optional[Dict[str, Any]] = None
@@ -102,7 +105,7 @@ class HuggingFaceClient:
         For vision models, we'll use chat completions with image input.
         
         Args:
-            image: Image as bytes
+            image: Image as bytes, or a string that is already base64-encoded
             prompt: Text prompt for the model
             model_id: Model ID (uses config default if None)
             parameters: Optional model parameters
@@ -114,11 +117,14 @@ class HuggingFaceClient:
         
         logger.info(f"Querying vision model: {model}")
         
-        # Encode image to base64
-        image_b64 = base64.b64encode(image).decode('utf-8')
+        # Encode image to base64 (strings are passed through as already encoded)
+        if isinstance(image, str):
+            image_b64 = image
+        else:
+            image_b64 = base64.b64encode(image).decode('ascii')
         
         # Use chat completions API with vision
-        url = "https://router.huggingface.co/v1/chat/completions"
+        url = CHAT_COMPLETIONS_URL
         
         payload = {
             "model": model,
@@ -183,7 +189,7 @@ class HuggingFaceClient:
         
         logger.info(f"Querying text model: {model}")
         
-        url = "https://router.huggingface.co/v1/chat/completions"
+        url = CHAT_COMPLETIONS_URL
         
         payload = {
             "model": model,
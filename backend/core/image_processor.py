@@ -9,13 +9,17 @@ Author: Chartered
 Version: 1.0.0
 """
 
-from PIL import Image, ImageEnhance, ImageOps
+from PIL import Image, ImageEnhance, ImageOps, ImageStat
 import io
+import math
 from typing import Tuple, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# One row holding every 8-bit value, used to tabulate per-pixel enhancements
+_VALUE_RAMP = Image.frombytes('L', (256, 1), bytes(range(256)))
+
 
 class ImageProcessor:
     """
@@ -145,22 +149,78 @@ class ImageProcessor:
         Returns:
             Enhanced PIL Image
         """
-        # Enhance contrast
-        contrast_enhancer = ImageEnhance.Contrast(image)
-        image = contrast_enhancer.enhance(contrast_factor)
-        
-        # Enhance brightness
-        brightness_enhancer = ImageEnhance.Brightness(image)
-        image = brightness_enhancer.enhance(brightness_factor)
+        if image.mode in ('RGB', 'RGBA', 'L'):
+            # Alpha is dropped below anyway, and the RGB bands enhance the same
+            if image.mode == 'RGBA':
+                image = image.convert('RGB')
+            # Contrast and brightness in one lookup pass
+            image = image.point(self._enhancement_lut(image, contrast_factor, brightness_factor))
+        else:
+            # Enhance contrast
+            contrast_enhancer = ImageEnhance.Contrast(image)
+            image = contrast_enhancer.enhance(contrast_factor)
+            
+            # Enhance brightness
+            brightness_enhancer = ImageEnhance.Brightness(image)
+            image = brightness_enhancer.enhance(brightness_factor)
         
         # Auto-equalize to normalize histogram
         # This helps with both dark and light mode charts
-        image = ImageOps.equalize(image.convert('RGB'))
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        image = ImageOps.equalize(image)
         
         self.logger.info(f"Applied contrast ({contrast_factor}) and brightness ({brightness_factor}) normalization")
         
         return image
     
+    def _enhancement_lut(
+        self,
+        image: Image.Image,
+        contrast_factor: float,
+        brightness_factor: float
+    ) -> list:
+        """
+        Build a point() table equal to ImageEnhance Contrast then Brightness.
+        
+        Both enhancers are per-pixel blends (towards the mean grey, then
+        towards black), so running the same blends over a 0-255 ramp yields
+        their exact combined lookup table.
+        
+        Args:
+            image: RGB or L image the table will be applied to
+            contrast_factor: Contrast enhancement factor
+            brightness_factor: Brightness enhancement factor
+            
+        Returns:
+            Band-sequential lookup table (256 entries per band)
+        """
+        mean = int(ImageStat.Stat(image.convert('L')).mean[0] + 0.5)
+        ramp = Image.merge(image.mode, [_VALUE_RAMP] * len(image.getbands()))
+        ramp = Image.blend(Image.new('L', ramp.size, mean).convert(image.mode), ramp, contrast_factor)
+        ramp = Image.blend(Image.new(image.mode, ramp.size, 0), ramp, brightness_factor)
+        return [value for band in ramp.split() for value in band.tobytes()]
+    
+    def _draft_for_model(self, image: Image.Image, cropped: bool) -> None:
+        """
+        Let a JPEG decode at a reduced DCT scale that still covers the model size.
+        
+        Must be called before the image is loaded; other formats are untouched.
+        
+        Args:
+            image: Freshly opened PIL Image
+            cropped: Whether UI margins will be cropped before resizing
+        """
+        if image.format != 'JPEG':
+            return
+        
+        width, height = self.TARGET_WIDTH, self.TARGET_HEIGHT
+        if cropped:
+            # Leave room for the margins remove_ui_elements takes off
+            width /= 1 - self.LEFT_MARGIN_PERCENT - self.RIGHT_MARGIN_PERCENT
+            height /= 1 - self.TOP_MARGIN_PERCENT - self.BOTTOM_MARGIN_PERCENT
+        image.draft(None, (math.ceil(width), math.ceil(height)))
+    
     def resize_for_model(
         self, 
         image: Image.Image,
@@ -240,6 +300,10 @@ class ImageProcessor:
         original_size = image.size
         original_format = image.format
         
+        # Large JPEGs only need decoding at about the size they are resized to
+        if resize:
+            self._draft_for_model(image, cropped=remove_ui)
+        
         # Load the image data to allow closing the stream
         image.load()
         
@@ -271,8 +335,9 @@ class ImageProcessor:
         
         # Preserve PNG format if original was PNG (better quality for charts with text)
         # Otherwise use JPEG for photos/complex images
+        # optimize=True (zlib level 9) costs ~2.5x the encode time for ~5% smaller output
         if original_format == 'PNG':
-            image.save(output_buffer, format='PNG', optimize=True)
+            image.save(output_buffer, format='PNG')
             output_format = 'PNG'
         else:
             # Use JPEG for other formats
@@ -313,6 +378,7 @@ class ImageProcessor:
         """
         image_stream = io.BytesIO(image_bytes)
         image = Image.open(image_stream)
+        self._draft_for_model(image, cropped=False)
         image.load()
         
         # Only apply light normalization and resize
@@ -9,40 +9,334 @@ Version: 1.0.0
 """
 
 import re
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, asdict
-from enum import Enum
+from dataclasses import dataclass, replace
+from types import MappingProxyType
 import logging
+import threading
+
+from backend.utils.regex_engine import compile_pattern as _compile
+
+# Optional SIMD multi-literal matcher (pip install hyperscan)
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
 logger = logging.getLogger(__name__)
 
 
-class StrategyBias(Enum):
-    """Strategy bias classification"""
-    BULLISH = "Bullish"
-    BEARISH = "Bearish"
-    NEUTRAL = "Neutral"
-    NEUTRAL_BULLISH = "Neutral to Bullish"
-    NEUTRAL_BEARISH = "Neutral to Bearish"
+@lru_cache(maxsize=128)
+def _compile_section(header: str):
+    """Compile the _extract_section body pattern for a header, once per header"""
+    return _compile(rf'{re.escape(header)}:?\s*\n(.+?)(?=\n\n|\n[A-Z]|\Z)', re.DOTALL | re.IGNORECASE)
 
 
-class ConfidenceLevel(Enum):
-    """Confidence level classification"""
-    HIGH = "High"
-    MEDIUM = "Medium"
-    LOW = "Low"
+@lru_cache(maxsize=128)
+def _compile_cached(pattern: str, flags: int = 0):
+    """Compile a caller-supplied pattern, once per distinct pattern"""
+    return _compile(pattern, flags)
 
 
-class MarketRegime(Enum):
-    """Market regime classification"""
-    TRENDING_BULLISH = "Trending (Bullish)"
-    TRENDING_BEARISH = "Trending (Bearish)"
-    RANGING = "Ranging"
-    BREAKOUT = "Breakout"
-    INDECISIVE = "Indecisive"
+# Precompiled field and cleanup patterns. Field captures start past any ':'
+# so an empty field yields no stray colon; values are still stripped, since
+# the \s around a capture does not trim every engine's notion of whitespace.
+_CHART_TYPE_RE = _compile(r'Chart Type:?\s*([^\s:](?:.*?\S)??)\s*(?:\n|$)', re.IGNORECASE)
+_TIMEFRAME_RE = _compile(r'(?:Timeframe|Time frame):?\s*([^\s:](?:.*?\S)??)\s*(?:\n|$)', re.IGNORECASE)
+_BULLET_BREAK_RE = _compile(r'\n•\s+')
+_BIAS_REASONING_RE = _compile(r'[-•]\s+(.+?)(?:\n|$)')
+_BOLD_RE = _compile(r'\*\*(.+?)\*\*')
+
+# Matched against lowercased text (captures are case-insensitive by nature)
+_PRICE_LEVEL_RE = _compile(r'(?:around|near|at)\s+(\d+\.?\d*)')
+_BIAS_CONFIDENCE_RE = _compile(r'confidence.*?(high|medium|low)')
+
+
+def _collapse_bullets(section: str, separator: str) -> str:
+    """Replace '•' bullet line breaks with separator, skipping the regex when there are none"""
+    if '\n•' not in section:
+        return section
+    return _BULLET_BREAK_RE.sub(separator, section)
+
+
+# Trading signal fields, tried in order until a usable value is found
+_ENTRY_PATTERNS = (
+    _compile(r'(?:Entry|Entry Level|Entry Zone|Entry Point):?\s*([^\s:](?:.*?\S)??)\s*(?:\n|,|;|$)', re.IGNORECASE),
+    _compile(r'(?:at|near|around)\s+([\d,.]+)', re.IGNORECASE),
+)
+_STOP_PATTERNS = (
+    _compile(r'(?:Stop Loss|Stop|SL):?\s*([^\s:](?:.*?\S)??)\s*(?:\n|,|;|$)', re.IGNORECASE),
+    _compile(r'(?:below|above)\s+([\d,.]+)', re.IGNORECASE),
+)
+
+# Single-pattern trading signal fields, keyed by TradingSignals attribute
+_TRADING_FIELDS = (
+    ("take_profit_1", _compile(r'(?:Take Profit|TP|Target)\s*(?:1|One)?:?\s*([^\s:](?:.*?\S)??)\s*(?:\n|,|;|$)', re.IGNORECASE)),
+    ("take_profit_2", _compile(r'(?:Take Profit|TP|Target)\s*(?:2|Two):?\s*([^\s:](?:.*?\S)??)\s*(?:\n|,|;|$)', re.IGNORECASE)),
+    ("risk_reward_ratio", _compile(r'(?:Risk[- ]Reward|R:R|RR):?\s*([^\s:](?:.*?\S)??)\s*(?:\n|,|;|$)', re.IGNORECASE)),
+    ("position_sizing", _compile(r'(?:Position Siz|Risk):?\s*([^\s:](?:.*?\S)??)\s*(?:\n|$)', re.IGNORECASE)),
+    ("timeframe_context", _compile(r'(?:Timeframe|Time Frame|Best for):?\s*([^\s:](?:.*?\S)??)\s*(?:\n|$)', re.IGNORECASE)),
+    ("confidence_score", _compile(r'(?:Confidence|Probability):?\s*([^\s:](?:.*?\S)??)\s*(?:\n|$)', re.IGNORECASE)),
+)
+
+def _section_body_patterns(header: str) -> tuple:
+    """
+    Compile the strict, inline and loose body patterns for a section header.
+    
+    Terminators are consumed rather than looked ahead so the patterns stay
+    RE2-compatible; only the captured body (stripped by callers) is used.
+    """
+    flags = re.DOTALL | re.IGNORECASE
+    return (
+        # Match with markdown headers or numbered sections
+        _compile(header + r':?\s*\n+(.+?)(?:\n+(?:\*\*)?(?:\d+\.|\#\#)|$)', flags),
+        # Match inline without newline requirement
+        _compile(header + r':?\s*(.+?)(?:\n+(?:\*\*)?(?:\d+\.|\#\#)|$)', flags),
+        # Simpler fallback
+        _compile(header + r'(.+?)(?:\n\n|$)', flags),
+    )
+
+
+_TRADING_SIGNALS_SECTION = _section_body_patterns(r'(?:\*\*)?(?:7\.?\s*)?Trading Signals?(?:\*\*)?')
+
+# Literal keyword contained in every header of a section. One overlapping scan
+# finds where each keyword first occurs, and the section's body patterns only
+# search from there (sections whose keyword is absent cannot match at all).
+_SECTION_KEYWORDS = {
+    'market_structure': 'market structure',
+    'momentum': 'momentum',
+    'regime': 'regime',
+    'strategy_bias': 'strategy bias',
+    'approaches': 'approach',
+    'invalidation': 'invalidation',
+    'trading_signals': 'trading signal',
+    'risks': 'risk',
+}
+_SECTION_KEYWORD_RE = _compile('(?=(' + '|'.join(_SECTION_KEYWORDS.values()) + '))')
+_SECTION_KEYWORD_LIST = tuple(_SECTION_KEYWORDS.values())
+
+if hyperscan is not None:
+    # Report only the first occurrence of each keyword
+    _SECTION_KEYWORD_DB = hyperscan.Database()
+    _SECTION_KEYWORD_DB.compile(
+        expressions=[keyword.encode() for keyword in _SECTION_KEYWORD_LIST],
+        ids=list(range(len(_SECTION_KEYWORD_LIST))),
+        elements=len(_SECTION_KEYWORD_LIST),
+        flags=hyperscan.HS_FLAG_SINGLEMATCH,
+    )
+else:
+    _SECTION_KEYWORD_DB = None
+
+# Hyperscan scratch space cannot be shared between concurrent scans
+_HYPERSCAN_LOCAL = threading.local()
+
+
+def _section_keyword_offsets(text_lower: str) -> Dict[str, int]:
+    """
+    Map each section keyword present in text_lower to its first offset.
+    
+    Uses Hyperscan when installed and the text is ASCII (so byte and
+    character offsets coincide), otherwise one overlapping regex scan.
+    """
+    offsets = {}
+    
+    if _SECTION_KEYWORD_DB is not None and text_lower.isascii():
+        scratch = getattr(_HYPERSCAN_LOCAL, 'scratch', None)
+        if scratch is None:
+            scratch = _HYPERSCAN_LOCAL.scratch = hyperscan.Scratch(_SECTION_KEYWORD_DB)
+        
+        def on_match(keyword_id, start, end, flags, context):
+            keyword = _SECTION_KEYWORD_LIST[keyword_id]
+            offsets[keyword] = end - len(keyword)
+        
+        _SECTION_KEYWORD_DB.scan(text_lower.encode('ascii'), match_event_handler=on_match, scratch=scratch)
+        return offsets
+    
+    for match in _SECTION_KEYWORD_RE.finditer(text_lower):
+        offsets.setdefault(match.group(1), match.start())
+        if len(offsets) == len(_SECTION_KEYWORD_LIST):
+            break
+    return offsets
+
+# Keyword classification tables: the first rule whose keywords all appear wins
+_BIAS_KEYWORDS = (
+    (("bullish",), "Bullish"),
+    (("bearish",), "Bearish"),
+    (("neutral",), "Neutral"),
+)
+_STRENGTH_KEYWORDS = (
+    (("strong", "bearish"), "Strong Bearish"),
+    (("strong", "bullish"), "Strong Bullish"),
+    (("weak", "bearish"), "Weak Bearish"),
+    (("weak", "bullish"), "Weak Bullish"),
+)
+_REGIME_CLASSES = (
+    (("trending", "bearish"), "Trending Bearish"),
+    (("trending", "bullish"), "Trending Bullish"),
+    (("trending",), "Trending"),
+    (("ranging",), "Ranging"),
+    (("range",), "Ranging"),
+    (("breakout",), "Breakout"),
+)
+_VOLATILITY_KEYWORDS = (
+    (("high",), "High"),
+    (("low",), "Low"),
+    (("moderate",), "Moderate"),
+)
+
+
+def _classify(text_lower: str, rules: tuple, default: str) -> str:
+    """Return the label of the first rule whose keywords all occur in text_lower"""
+    for keywords, label in rules:
+        if all(keyword in text_lower for keyword in keywords):
+            return label
+    return default
 
 
-@dataclass
+# Numbered/bulleted approach names, or bold bulleted names
+_APPROACH_RE = _compile(
+    r'(?:[-•\d]+\.?\s*)(?P<plain>[A-Z][a-z\-]+(?:\s+[A-Z][a-z\-]+)*)'
+    r'|(?:[-•]\s*)\*\*(?P<bold>.+?)\*\*'
+)
+
+
+def _keyword_window(text: str, text_lower: str, keyword: str, width: int, start: int = 0) -> Optional[tuple]:
+    """
+    Slice the context window around a keyword without running a regex.
+    
+    Equivalent to searching ``.{0,width}keyword.{0,width}`` case-insensitively
+    from ``start``: the window opens up to ``width`` characters before the first
+    occurrence and closes ``width`` characters after the last occurrence the
+    opening can still reach.
+    
+    Args:
+        text: Original text to slice
+        text_lower: Lowercased copy of text
+        keyword: Lowercase keyword to look for
+        width: Context characters on either side
+        start: Offset to begin searching from
+        
+    Returns:
+        (begin, end) offsets of the window, or None if keyword is absent
+    """
+    if len(text_lower) != len(text):
+        # lower() changed the length (e.g. 'İ'), so text_lower offsets do not
+        # map onto text; fall back to the equivalent regex on text itself
+        match = _compile_cached(
+            rf'.{{0,{width}}}{re.escape(keyword)}.{{0,{width}}}', re.IGNORECASE | re.DOTALL
+        ).search(text, start)
+        return match.span() if match else None
+    
+    first = text_lower.find(keyword, start)
+    if first < 0:
+        return None
+    begin = max(start, first - width)
+    last = text_lower.rfind(keyword, begin, begin + width + len(keyword))
+    return begin, min(len(text), last + len(keyword) + width)
+
+
+# Keywords whose surrounding context is used when a section header cannot be found
+_MOMENTUM_KEYWORDS = ('momentum', 'rsi', 'macd', 'moving average', 'indicator')
+_REGIME_KEYWORDS = ('trending', 'ranging', 'breakout', 'indecisive', 'consolidat')
+_SIGNAL_KEYWORDS = ('entry', 'stop loss', 'target', 'buy', 'sell')
+_RISK_KEYWORDS = ('risk', 'caution', 'uncertainty', 'monitor')
+
+# Invalidation conditions, tried in order until a usable condition is found
+_BULLISH_INVALIDATION_PATTERNS = (
+    _compile(r'bullish.*?(?:invalidated|invalid|scenario).*?(?:if|:)\s*(.+?)(?:\n[\-•]|\nbear|$)', re.IGNORECASE | re.DOTALL),
+    _compile(r'(?:if|when)\s+price\s+(?:breaks?|falls?|closes?)\s+below\s+(.+?)(?:\n|,|$)', re.IGNORECASE | re.DOTALL),
+)
+_BEARISH_INVALIDATION_PATTERNS = (
+    _compile(r'bearish.*?(?:invalidated|invalid|scenario).*?(?:if|:)\s*(.+?)(?:\n[\-•]|\nkey|$)', re.IGNORECASE | re.DOTALL),
+    _compile(r'(?:if|when)\s+price\s+(?:breaks?|rises?|closes?)\s+above\s+(.+?)(?:\n|,|$)', re.IGNORECASE | re.DOTALL),
+)
+_KEY_LEVEL_PATTERNS = (
+    _compile(r'key.*?(?:decision|level|price).*?:?\s*(.+?)(?:\n|$)', re.IGNORECASE),
+    _compile(r'(?:watch|monitor).*?level.*?:?\s*(.+?)(?:\n|$)', re.IGNORECASE),
+)
+# Matched against lowercased text
+_SUPPORT_RE = _compile(r'support.*?(?:at|near|around)\s+([\d,.]+)')
+_RESISTANCE_RE = _compile(r'resistance.*?(?:at|near|around)\s+([\d,.]+)')
+
+# List item alternations for _extract_list_items; each match fills exactly one group
+_LIST_ITEM_RE = _compile(
+    r'(?:[-•*]\s*(.+?)'            # Bullet points
+    r'|\d+\.\s*(.+?))(?:\n|$)',     # Numbered lists
+    re.MULTILINE,
+)
+_RISK_LIST_RE = _compile(
+    r'(?:[-•*]\s*(.+?)'                            # Bullet points
+    r'|(?:Risk|Caution|Warning):?\s*(.+?)'
+    r'|(?:may|could|might)\s+(.+?))(?:\n|$)',      # Uncertainty language
+    re.MULTILINE,
+)
+_CONFLICTING_LIST_RE = _compile(
+    r'(?:(?:Conflict|Conflicting|Divergence):?\s*(.+?)'
+    r'|(?:however|but|although)\s+(.+?))(?:\n|$)',
+    re.MULTILINE,
+)
+_MONITORING_LIST_RE = _compile(
+    r'(?:(?:Monitor|Watch|Track|Check):?\s*(.+?)'
+    r'|(?:key level|important level):?\s*(.+?))(?:\n|$)',
+    re.MULTILINE,
+)
+# Literals one of which every conflicting/monitoring match contains; sections
+# without any of them skip that scan
+_CONFLICTING_TRIGGERS = ('Conflict', 'Divergence', 'however', 'but', 'although')
+_MONITORING_TRIGGERS = ('Monitor', 'Watch', 'Track', 'Check', 'key level', 'important level')
+_UNCERTAINTY_RE = _compile(r'(?:Uncertainty|Acknowledgment|Disclaimer):?\s*(.+?)(?:\n\n|$)', re.IGNORECASE)
+
+# Default approaches by overall bias when none can be extracted
+_APPROACH_KEYWORDS = ('trend-following', 'mean-reversion', 'breakout', 'range trading', 'wait-and-see')
+_BULLISH_APPROACHES = (
+    {"name": "Trend-following", "rationale": "Aligned with bullish bias"},
+    {"name": "Breakout trading", "rationale": "Look for continuation patterns"},
+)
+_BEARISH_APPROACHES = (
+    {"name": "Trend-following", "rationale": "Aligned with bearish bias"},
+    {"name": "Short selling", "rationale": "Consider downside opportunities"},
+)
+_NEUTRAL_APPROACHES = (
+    {"name": "Wait-and-see", "rationale": "Await clearer signals"},
+    {"name": "Range trading", "rationale": "Trade within defined levels"},
+)
+
+# Default risk considerations
+_DEFAULT_RISKS = ("Market volatility risk", "Timing risk", "External factors may impact outcome")
+_DEFAULT_MONITORING = ("Price action at key levels", "Volume confirmation", "Overall market conditions")
+_DEFAULT_UNCERTAINTY_NOTE = "Markets are inherently uncertain. This analysis is for educational purposes only."
+
+# Number of distinct raw outputs whose parse results are memoized
+PARSE_CACHE_SIZE = 256
+
+
+# Classification labels, keyed by name. Result fields hold the plain strings.
+STRATEGY_BIAS = MappingProxyType({
+    "BULLISH": "Bullish",
+    "BEARISH": "Bearish",
+    "NEUTRAL": "Neutral",
+    "NEUTRAL_BULLISH": "Neutral to Bullish",
+    "NEUTRAL_BEARISH": "Neutral to Bearish",
+})
+
+CONFIDENCE_LEVEL = MappingProxyType({
+    "HIGH": "High",
+    "MEDIUM": "Medium",
+    "LOW": "Low",
+})
+
+MARKET_REGIME = MappingProxyType({
+    "TRENDING_BULLISH": "Trending (Bullish)",
+    "TRENDING_BEARISH": "Trending (Bearish)",
+    "RANGING": "Ranging",
+    "BREAKOUT": "Breakout",
+    "INDECISIVE": "Indecisive",
+})
+
+
+@dataclass(slots=True)
 class VisionAnalysis:
     """Structured vision model output"""
     chart_type: str
@@ -54,7 +348,7 @@ class VisionAnalysis:
     raw_output: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketStructure:
     """Market structure assessment"""
     trend_description: str
@@ -62,7 +356,7 @@ class MarketStructure:
     structural_notes: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class MomentumAnalysis:
     """Momentum analysis"""
     assessment: str
@@ -71,7 +365,7 @@ class MomentumAnalysis:
     strength: str
 
 
-@dataclass
+@dataclass(slots=True)
 class RegimeClassification:
     """Market regime classification"""
     regime: str
@@ -79,7 +373,7 @@ class RegimeClassification:
     volatility: str
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategyBiasAnalysis:
     """Strategy bias assessment"""
     bias: str
@@ -87,14 +381,14 @@ class StrategyBiasAnalysis:
     reasoning: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class SuitableApproaches:
     """Suitable trading approaches"""
     approaches: List[Dict[str, str]]  # [{"name": "...", "rationale": "..."}]
     recommended: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class InvalidationConditions:
     """Invalidation scenarios"""
     bullish_invalidation: List[str]
@@ -102,7 +396,7 @@ class InvalidationConditions:
     key_levels: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class TradingSignals:
     """Trading signal recommendations with specific levels"""
     signal_type: str  # "BUY", "SELL", "WAIT", "NO CLEAR SIGNAL"
@@ -116,7 +410,7 @@ class TradingSignals:
     confidence_score: Optional[str]  # e.g., "High (75-85%)"
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskConsiderations:
     """Risk and uncertainty assessment"""
     risks: List[str]
@@ -125,7 +419,7 @@ class RiskConsiderations:
     uncertainty_note: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ReasoningAnalysis:
     """Complete structured reasoning output"""
     market_structure: MarketStructure
@@ -139,7 +433,7 @@ class ReasoningAnalysis:
     raw_output: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CompleteAnalysis:
     """Complete analysis combining vision and reasoning"""
     vision: VisionAnalysis
@@ -147,6 +441,85 @@ class CompleteAnalysis:
     metadata: Dict[str, Any]
 
 
+# Field names per result dataclass, so _result_to_dict tells leaves from
+# nested results with one dict lookup instead of a failing hasattr
+_RESULT_FIELDS = {
+    cls: tuple(cls.__dataclass_fields__)
+    for cls in (
+        VisionAnalysis, MarketStructure, MomentumAnalysis, RegimeClassification,
+        StrategyBiasAnalysis, SuitableApproaches, InvalidationConditions,
+        TradingSignals, RiskConsiderations, ReasoningAnalysis, CompleteAnalysis,
+    )
+}
+
+
+def _result_to_dict(value: Any) -> Any:
+    """
+    Convert nested result dataclasses to plain dicts.
+    
+    Unlike dataclasses.asdict, leaf lists and dicts are shared rather than
+    deep-copied; results are read-only so the copy only cost time.
+    """
+    names = _RESULT_FIELDS.get(type(value))
+    if names is None:
+        return value
+    return {name: _result_to_dict(getattr(value, name)) for name in names}
+
+
+# Structure returned when reasoning parsing fails, built once. Sections are
+# shared between fallback results and must be treated as read-only.
+_FALLBACK_REASONING = ReasoningAnalysis(
+    market_structure=MarketStructure(
+        trend_description="Analysis unavailable",
+        key_levels=["Parsing error"],
+        structural_notes=[]
+    ),
+    momentum=MomentumAnalysis(
+        assessment="Analysis unavailable",
+        indicators=[],
+        divergences=[],
+        strength="Unknown"
+    ),
+    regime=RegimeClassification(
+        regime="Indecisive",
+        reasoning="Parsing error",
+        volatility="Unknown"
+    ),
+    strategy_bias=StrategyBiasAnalysis(
+        bias="Neutral",
+        confidence="Low",
+        reasoning=["Analysis unavailable due to parsing error"]
+    ),
+    suitable_approaches=SuitableApproaches(
+        approaches=[{"name": "Wait-and-see", "rationale": "Analysis unavailable"}],
+        recommended="Wait-and-see"
+    ),
+    invalidation=InvalidationConditions(
+        bullish_invalidation=["Not available"],
+        bearish_invalidation=["Not available"],
+        key_levels=["Not available"]
+    ),
+    trading_signals=TradingSignals(
+        signal_type="WAIT",
+        entry_level="Not available",
+        stop_loss="Not available",
+        take_profit_1="Not available",
+        take_profit_2=None,
+        risk_reward_ratio="Not available",
+        position_sizing="Not available",
+        timeframe_context=None,
+        confidence_score="Not available"
+    ),
+    risks=RiskConsiderations(
+        risks=["Analysis unavailable"],
+        conflicting_signals=[],
+        monitoring_points=[],
+        uncertainty_note="Parsing error occurred"
+    ),
+    raw_output=""
+)
+
+
 class ResponseParser:
     """
     Parser for AI model outputs.
@@ -167,6 +540,13 @@ class ResponseParser:
         'risks': r'(?:###?\s*)?(?:\*\*)?(?:8\.?\s*)?Risk(?:\s+Considerations)?(?:\*\*)?',
     }
     
+    # Body patterns for each section header, compiled once
+    SECTION_BODY_PATTERNS = {
+        key: _section_body_patterns(header) for key, header in SECTION_PATTERNS.items()
+    }
+    # Trading signals are matched without the markdown heading prefix
+    SECTION_BODY_PATTERNS['trading_signals'] = _TRADING_SIGNALS_SECTION
+    
     def __init__(self):
         """Initialize the parser"""
         self.logger = logging.getLogger(__name__)
@@ -175,15 +555,34 @@ class ResponseParser:
         """
         Parse vision model output into structured format.
         
+        Results are memoized by content, so repeated outputs share one
+        result object; treat it as read-only.
+        
         Args:
             raw_output: Raw text from vision model
             
         Returns:
             VisionAnalysis object
         """
+        return _parse_vision_cached(raw_output)
+    
+    def _parse_vision(self, raw_output: str) -> VisionAnalysis:
+        """Parse vision model output (uncached)"""
         try:
+            # Blank output (empty or timed-out responses) cannot match any field
+            if not raw_output or raw_output.isspace():
+                return VisionAnalysis(
+                    chart_type="Unknown",
+                    timeframe=None,
+                    price_structure="Not available",
+                    indicators_detected=[],
+                    visual_patterns=[],
+                    momentum_signals="Not available",
+                    raw_output=raw_output
+                )
+            
             # Extract chart type and timeframe
-            chart_type_line = self._extract_field(raw_output, r'Chart Type:?\s*(.+?)(?:\n|$)')
+            chart_type_line = self._extract_field(raw_output, _CHART_TYPE_RE)
             
             # Try to extract timeframe from chart type line or separate field
             timeframe = None
@@ -193,7 +592,7 @@ class ResponseParser:
                 timeframe = parts[1].strip()
             else:
                 chart_type = chart_type_line
-                timeframe = self._extract_field(raw_output, r'(?:Timeframe|Time frame):?\s*(.+?)(?:\n|$)')
+                timeframe = self._extract_field(raw_output, _TIMEFRAME_RE)
             
             # Extract price structure
             price_structure = self._extract_section(raw_output, 'Price Structure')
@@ -236,22 +635,49 @@ class ResponseParser:
         """
         Parse reasoning model output into structured format.
         
+        Results are memoized by content, so repeated outputs share one
+        result object; treat it as read-only.
+        
         Args:
             raw_output: Raw text from reasoning model
             
         Returns:
             ReasoningAnalysis object
         """
+        return _parse_reasoning_cached(raw_output)
+    
+    def _parse_reasoning(self, raw_output: str) -> ReasoningAnalysis:
+        """Parse reasoning model output (uncached)"""
         try:
-            # Parse each section
-            market_structure = self._parse_market_structure(raw_output)
-            momentum = self._parse_momentum(raw_output)
-            regime = self._parse_regime(raw_output)
-            strategy_bias = self._parse_strategy_bias(raw_output)
-            approaches = self._parse_approaches(raw_output)
-            invalidation = self._parse_invalidation(raw_output)
-            trading_signals = self._parse_trading_signals(raw_output)
-            risks = self._parse_risks(raw_output)
+            # Section parsers are independent of each other
+            section_parsers = (
+                ('market_structure', self._parse_market_structure),
+                ('momentum', self._parse_momentum),
+                ('regime', self._parse_regime),
+                ('strategy_bias', self._parse_strategy_bias),
+                ('approaches', self._parse_approaches),
+                ('invalidation', self._parse_invalidation),
+                ('trading_signals', self._parse_trading_signals),
+                ('risks', self._parse_risks),
+            )
+            
+            # Blank output (empty or timed-out responses) cannot match any
+            # section or keyword, so only the defaults need building
+            if not raw_output or raw_output.isspace():
+                results = [fn("", "", "") for _, fn in section_parsers]
+            else:
+                results = self._parse_sections(raw_output, section_parsers)
+            
+            (
+                market_structure,
+                momentum,
+                regime,
+                strategy_bias,
+                approaches,
+                invalidation,
+                trading_signals,
+                risks,
+            ) = results
             
             return ReasoningAnalysis(
                 market_structure=market_structure,
@@ -270,9 +696,17 @@ class ResponseParser:
             # Return minimal valid structure
             return self._get_fallback_reasoning(raw_output)
     
-    def _parse_market_structure(self, text: str) -> MarketStructure:
+    def _parse_sections(self, raw_output: str, section_parsers: tuple) -> list:
+        """Split raw_output into sections and run each (name, parser) pair on its body"""
+        # Split out every section up front, sharing one lowercased copy of the output
+        text_lower = raw_output.lower()
+        sections = self._split_sections(raw_output, text_lower)
+        
+        # Parse each section
+        return [fn(raw_output, text_lower, sections[name]) for name, fn in section_parsers]
+    
+    def _parse_market_structure(self, text: str, text_lower: str, section: str) -> MarketStructure:
         """Parse market structure section"""
-        section = self._extract_section_by_pattern(text, self.SECTION_PATTERNS['market_structure'])
         
         if not section:
             return MarketStructure(
@@ -282,14 +716,14 @@ class ResponseParser:
             )
         
         # Clean the section - remove excessive bullet fragments
-        section = re.sub(r'\n•\s+', '\n', section)
+        section = _collapse_bullets(section, '\n')
         
         # Just use the full section as trend description
         # Extract only explicit "Key Levels:" or "Support/Resistance:" subsections
         key_levels = []
-        if 'key level' in section.lower() or 'support' in section.lower() or 'resistance' in section.lower():
-            level_matches = re.findall(r'(?:around|near|at)\s+(\d+\.?\d*)', section, re.IGNORECASE)
-            key_levels = [f"Level: {level}" for level in level_matches[:5]]
+        section_lower = section.lower()
+        if 'key level' in section_lower or 'support' in section_lower or 'resistance' in section_lower:
+            key_levels = [f"Level: {match.group(1)}" for match in islice(_PRICE_LEVEL_RE.finditer(section_lower), 5)]
         
         return MarketStructure(
             trend_description=section.strip(),
@@ -297,23 +731,25 @@ class ResponseParser:
             structural_notes=[]
         )
     
-    def _parse_momentum(self, text: str) -> MomentumAnalysis:
+    def _parse_momentum(self, text: str, text_lower: str, section: str) -> MomentumAnalysis:
         """Parse momentum analysis section"""
-        section = self._extract_section_by_pattern(text, self.SECTION_PATTERNS['momentum'])
         
         # If section is empty, try to extract from context
         if not section or len(section) < 15:
             # Look for momentum-related content anywhere in text
-            momentum_keywords = ['momentum', 'rsi', 'macd', 'moving average', 'indicator']
-            for keyword in momentum_keywords:
-                if keyword in text.lower():
-                    # Extract surrounding context
-                    pattern = rf'(.{{0,200}}{keyword}.{{0,200}})'
-                    matches = re.finditer(pattern, text, re.IGNORECASE | re.DOTALL)
-                    sections = [m.group(1).strip() for m in matches]
-                    if sections:
-                        section = ' '.join(sections[:2])
+            for keyword in _MOMENTUM_KEYWORDS:
+                # Extract surrounding context of the first two mentions
+                sections = []
+                start = 0
+                while len(sections) < 2:
+                    window = _keyword_window(text, text_lower, keyword, 200, start)
+                    if window is None:
                         break
+                    sections.append(text[window[0]:window[1]].strip())
+                    start = window[1]
+                if sections:
+                    section = ' '.join(sections)
+                    break
         
         if not section or len(section) < 10:
             return MomentumAnalysis(
@@ -324,19 +760,10 @@ class ResponseParser:
             )
         
         # Clean the section
-        section = re.sub(r'\n•\s+', ' ', section)
+        section = _collapse_bullets(section, ' ')
         
         # Determine strength from keywords
-        strength = "Mixed"
-        section_lower = section.lower()
-        if "strong" in section_lower and "bearish" in section_lower:
-            strength = "Strong Bearish"
-        elif "strong" in section_lower and "bullish" in section_lower:
-            strength = "Strong Bullish"
-        elif "weak" in section_lower and "bearish" in section_lower:
-            strength = "Weak Bearish"
-        elif "weak" in section_lower and "bullish" in section_lower:
-            strength = "Weak Bullish"
+        strength = _classify(section.lower(), _STRENGTH_KEYWORDS, "Mixed")
         
         return MomentumAnalysis(
             assessment=section[:500].strip(),
@@ -345,20 +772,16 @@ class ResponseParser:
             strength=strength
         )
     
-    def _parse_regime(self, text: str) -> RegimeClassification:
+    def _parse_regime(self, text: str, text_lower: str, section: str) -> RegimeClassification:
         """Parse market regime section"""
-        section = self._extract_section_by_pattern(text, self.SECTION_PATTERNS['regime'])
         
         # Enhanced fallback - look for regime keywords anywhere
         if not section or len(section) < 10:
-            regime_keywords = ['trending', 'ranging', 'breakout', 'indecisive', 'consolidat']
-            for keyword in regime_keywords:
-                if keyword in text.lower():
-                    pattern = rf'(.{{0,150}}{keyword}.{{0,150}})'
-                    match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-                    if match:
-                        section = match.group(1).strip()
-                        break
+            for keyword in _REGIME_KEYWORDS:
+                window = _keyword_window(text, text_lower, keyword, 150)
+                if window:
+                    section = text[window[0]:window[1]].strip()
+                    break
         
         if not section or len(section) < 10:
             return RegimeClassification(
@@ -368,31 +791,16 @@ class ResponseParser:
             )
         
         # Clean the section
-        section = re.sub(r'\n•\s+', ' ', section)
+        section = _collapse_bullets(section, ' ')
         
         # Extract regime classification with better matching
-        regime = "Indecisive"
         section_lower = section.lower()
-        if "trending" in section_lower and "bearish" in section_lower:
-            regime = "Trending Bearish"
-        elif "trending" in section_lower and "bullish" in section_lower:
-            regime = "Trending Bullish"
-        elif "trending" in section_lower:
-            regime = "Trending"
-        elif "ranging" in section_lower or "range" in section_lower:
-            regime = "Ranging"
-        elif "breakout" in section_lower:
-            regime = "Breakout"
+        regime = _classify(section_lower, _REGIME_CLASSES, "Indecisive")
         
         # Extract volatility if mentioned
         volatility = "Unknown"
         if "volatility" in section_lower:
-            if "high" in section_lower:
-                volatility = "High"
-            elif "low" in section_lower:
-                volatility = "Low"
-            elif "moderate" in section_lower:
-                volatility = "Moderate"
+            volatility = _classify(section_lower, _VOLATILITY_KEYWORDS, "Unknown")
         
         return RegimeClassification(
             regime=regime,
@@ -400,9 +808,8 @@ class ResponseParser:
             volatility=volatility
         )
     
-    def _parse_strategy_bias(self, text: str) -> StrategyBiasAnalysis:
+    def _parse_strategy_bias(self, text: str, text_lower: str, section: str) -> StrategyBiasAnalysis:
         """Parse strategy bias section"""
-        section = self._extract_section_by_pattern(text, self.SECTION_PATTERNS['strategy_bias'])
         
         if not section:
             return StrategyBiasAnalysis(
@@ -412,23 +819,20 @@ class ResponseParser:
             )
         
         # Clean the section
-        section = re.sub(r'\n•\s+', '\n', section)
+        section = _collapse_bullets(section, '\n')
         
         # Extract bias
-        bias = "Neutral"
-        for keyword in ["Bullish", "Bearish", "Neutral"]:
-            if keyword.lower() in section.lower():
-                bias = keyword
-                break
+        section_lower = section.lower()
+        bias = _classify(section_lower, _BIAS_KEYWORDS, "Neutral")
         
         # Extract confidence
         confidence = "Medium"
-        confidence_match = re.search(r'confidence.*?(high|medium|low)', section, re.IGNORECASE)
+        confidence_match = _BIAS_CONFIDENCE_RE.search(section_lower)
         if confidence_match:
             confidence = confidence_match.group(1).capitalize()
         
         # Extract bullet points as reasoning
-        reasoning_points = re.findall(r'[-•]\s+(.+?)(?:\n|$)', section)
+        reasoning_points = _BIAS_REASONING_RE.findall(section)
         if not reasoning_points:
             reasoning_points = [section.strip()]
         
@@ -438,9 +842,8 @@ class ResponseParser:
             reasoning=reasoning_points[:5]
         )
     
-    def _parse_approaches(self, text: str) -> SuitableApproaches:
+    def _parse_approaches(self, text: str, text_lower: str, section: str) -> SuitableApproaches:
         """Parse suitable approaches section"""
-        section = self._extract_section_by_pattern(text, self.SECTION_PATTERNS['approaches'])
         
         approaches = []
         recommended = None
@@ -448,9 +851,8 @@ class ResponseParser:
         # If no section found, extract from general text
         if not section or len(section) < 15:
             # Look for approach-related keywords
-            approach_keywords = ['trend-following', 'mean-reversion', 'breakout', 'range trading', 'wait-and-see']
-            for keyword in approach_keywords:
-                if keyword.lower() in text.lower():
+            for keyword in _APPROACH_KEYWORDS:
+                if keyword in text_lower:
                     approaches.append({
                         "name": keyword.title(),
                         "rationale": "Mentioned in analysis"
@@ -461,112 +863,75 @@ class ResponseParser:
         
         # Try to extract structured approaches
         if section:
-            # Look for numbered or bulleted approaches
-            approach_patterns = [
-                r'(?:[-•\d]+\.?\s*)([A-Z][a-z\-]+(?:\s+[A-Z][a-z\-]+)*)',
-                r'(?:[-•]\s*)\*\*(.+?)\*\*',
-            ]
+            # Look for numbered or bulleted approaches in one pass, keeping
+            # bold names only when no plain names are found
+            plain_approaches, bold_approaches = [], []
+            for match in _APPROACH_RE.finditer(section):
+                plain_name = match.group('plain')
+                found = plain_approaches if plain_name is not None else bold_approaches
+                name = (plain_name or match.group('bold')).strip()
+                if len(name) > 3 and len(name) < 50:  # Reasonable length
+                    # Extract rationale from following text
+                    start = match.end()
+                    end = min(start + 150, len(section))
+                    rationale_text = section[start:end].partition('\n')[0]
+                    
+                    found.append({
+                        "name": name,
+                        "rationale": rationale_text.strip() if rationale_text else "See analysis"
+                    })
             
-            for pattern in approach_patterns:
-                matches = re.finditer(pattern, section)
-                for match in matches:
-                    name = match.group(1).strip()
-                    if len(name) > 3 and len(name) < 50:  # Reasonable length
-                        # Extract rationale from following text
-                        start = match.end()
-                        end = min(start + 150, len(section))
-                        rationale_text = section[start:end].split('\n')[0]
-                        
-                        approaches.append({
-                            "name": name,
-                            "rationale": rationale_text.strip() if rationale_text else "See analysis"
-                        })
-                
-                if approaches:
-                    break
+            approaches = plain_approaches or bold_approaches
         
         # Fallback: return default approaches based on strategy bias
         if not approaches:
-            if "bullish" in text.lower():
-                approaches = [
-                    {"name": "Trend-following", "rationale": "Aligned with bullish bias"},
-                    {"name": "Breakout trading", "rationale": "Look for continuation patterns"}
-                ]
-            elif "bearish" in text.lower():
-                approaches = [
-                    {"name": "Trend-following", "rationale": "Aligned with bearish bias"},
-                    {"name": "Short selling", "rationale": "Consider downside opportunities"}
-                ]
+            if "bullish" in text_lower:
+                approaches = list(_BULLISH_APPROACHES)
+            elif "bearish" in text_lower:
+                approaches = list(_BEARISH_APPROACHES)
             else:
-                approaches = [
-                    {"name": "Wait-and-see", "rationale": "Await clearer signals"},
-                    {"name": "Range trading", "rationale": "Trade within defined levels"}
-                ]
+                approaches = list(_NEUTRAL_APPROACHES)
         
         return SuitableApproaches(
             approaches=approaches[:3],
             recommended=approaches[0]["name"] if approaches else None
         )
     
-    def _parse_invalidation(self, text: str) -> InvalidationConditions:
+    def _parse_invalidation(self, text: str, text_lower: str, section: str) -> InvalidationConditions:
         """Parse invalidation conditions section"""
-        section = self._extract_section_by_pattern(text, self.SECTION_PATTERNS['invalidation'])
+        target = section or text
         
         # Extract bullish invalidation
         bullish_invalidation = []
-        bullish_patterns = [
-            r'bullish.*?(?:invalidated|invalid|scenario).*?(?:if|:)\s*(.+?)(?=\n[\-•]|\nbear|$)',
-            r'(?:if|when)\s+price\s+(?:breaks?|falls?|closes?)\s+below\s+(.+?)(?=\n|,|$)',
-        ]
-        
-        for pattern in bullish_patterns:
-            match = re.search(pattern, section or text, re.IGNORECASE | re.DOTALL)
-            if match:
-                condition = match.group(1).strip()
-                if condition and len(condition) > 5:
-                    bullish_invalidation.append(condition[:200])
-                    break
+        for pattern in _BULLISH_INVALIDATION_PATTERNS:
+            if (match := pattern.search(target)) and len(condition := match.group(1).strip()) > 5:
+                bullish_invalidation.append(condition[:200])
+                break
         
         # Extract bearish invalidation
         bearish_invalidation = []
-        bearish_patterns = [
-            r'bearish.*?(?:invalidated|invalid|scenario).*?(?:if|:)\s*(.+?)(?=\n[\-•]|\nkey|$)',
-            r'(?:if|when)\s+price\s+(?:breaks?|rises?|closes?)\s+above\s+(.+?)(?=\n|,|$)',
-        ]
-        
-        for pattern in bearish_patterns:
-            match = re.search(pattern, section or text, re.IGNORECASE | re.DOTALL)
-            if match:
-                condition = match.group(1).strip()
-                if condition and len(condition) > 5:
-                    bearish_invalidation.append(condition[:200])
-                    break
+        for pattern in _BEARISH_INVALIDATION_PATTERNS:
+            if (match := pattern.search(target)) and len(condition := match.group(1).strip()) > 5:
+                bearish_invalidation.append(condition[:200])
+                break
         
         # Extract key levels
         key_levels = []
-        key_patterns = [
-            r'key.*?(?:decision|level|price).*?:?\s*(.+?)(?=\n|$)',
-            r'(?:watch|monitor).*?level.*?:?\s*(.+?)(?=\n|$)',
-        ]
-        
-        for pattern in key_patterns:
-            match = re.search(pattern, section or text, re.IGNORECASE)
-            if match:
-                levels = match.group(1).strip()
-                if levels and len(levels) > 5:
-                    key_levels.append(levels[:150])
-                    break
+        for pattern in _KEY_LEVEL_PATTERNS:
+            if (match := pattern.search(target)) and len(levels := match.group(1).strip()) > 5:
+                key_levels.append(levels[:150])
+                break
         
         # Smart fallbacks based on strategy bias
         if not bullish_invalidation:
-            if "support" in text.lower():
-                support_match = re.search(r'support.*?(?:at|near|around)\s+([\d,.]+)', text, re.IGNORECASE)
+            if "support" in text_lower:
+                support_match = _SUPPORT_RE.search(text_lower)
                 if support_match:
                     bullish_invalidation = [f"Break below support at {support_match.group(1)}"]
         
         if not bearish_invalidation:
-            if "resistance" in text.lower():
-                resistance_match = re.search(r'resistance.*?(?:at|near|around)\s+([\d,.]+)', text, re.IGNORECASE)
+            if "resistance" in text_lower:
+                resistance_match = _RESISTANCE_RE.search(text_lower)
                 if resistance_match:
                     bearish_invalidation = [f"Break above resistance at {resistance_match.group(1)}"]
         
@@ -576,23 +941,19 @@ class ResponseParser:
             key_levels=key_levels if key_levels else ["Refer to market structure section"]
         )
     
-    def _parse_trading_signals(self, text: str) -> TradingSignals:
+    def _parse_trading_signals(self, text: str, text_lower: str, section: str) -> TradingSignals:
         """Parse trading signals section"""
-        section = self._extract_section_by_pattern(text, self.SECTION_PATTERNS.get('signals', r'(?:\*\*)?(?:7\.?\s*)?Trading Signals?(?:\*\*)?'))
         
         # Fallback to searching for signal keywords if no section found
         if not section or len(section) < 20:
-            signal_keywords = ['entry', 'stop loss', 'target', 'buy', 'sell']
-            for keyword in signal_keywords:
-                if keyword in text.lower():
-                    pattern = rf'(.{{0,300}}{keyword}.{{0,300}})'
-                    match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-                    if match:
-                        section = match.group(1).strip()
-                        break
+            for keyword in _SIGNAL_KEYWORDS:
+                window = _keyword_window(text, text_lower, keyword, 300)
+                if window:
+                    section = text[window[0]:window[1]].strip()
+                    break
         
         if not section or len(section) < 20:
-            return self._generate_signals_from_bias(text)
+            return self._generate_signals_from_bias(text, text_lower)
         
         # Extract signal type with more patterns
         signal_type = "NO CLEAR SIGNAL"
@@ -604,71 +965,46 @@ class ResponseParser:
         elif "wait" in section_lower or "no clear signal" in section_lower:
             signal_type = "WAIT"
         
-        # Extract entry level with multiple patterns
-        entry_patterns = [
-            r'(?:Entry|Entry Level|Entry Zone|Entry Point):?\s*(.+?)(?:\n|,|;|$)',
-            r'(?:at|near|around)\s+([\d,.]+)',
-        ]
+        # Extract entry level and stop loss with multiple patterns
         entry_level = None
-        for pattern in entry_patterns:
-            entry_level = self._extract_field(section, pattern)
-            if entry_level and len(entry_level) > 3:
+        for pattern in _ENTRY_PATTERNS:
+            if (entry_level := self._extract_field(section, pattern)) and len(entry_level) > 3:
                 break
         
-        # Extract stop loss
-        stop_patterns = [
-            r'(?:Stop Loss|Stop|SL):?\s*(.+?)(?:\n|,|;|$)',
-            r'(?:below|above)\s+([\d,.]+)',
-        ]
         stop_loss = None
-        for pattern in stop_patterns:
-            stop_loss = self._extract_field(section, pattern)
-            if stop_loss and len(stop_loss) > 3:
+        for pattern in _STOP_PATTERNS:
+            if (stop_loss := self._extract_field(section, pattern)) and len(stop_loss) > 3:
                 break
         
-        # Extract take profit targets
-        tp_patterns = [
-            r'(?:Take Profit|TP|Target)\s*(?:1|One)?:?\s*(.+?)(?:\n|,|;|$)',
-            r'(?:Take Profit|TP|Target)\s*(?:2|Two):?\s*(.+?)(?:\n|,|;|$)',
-        ]
-        take_profit_1 = self._extract_field(section, tp_patterns[0])
-        take_profit_2 = self._extract_field(section, tp_patterns[1])
-        
-        # Extract risk-reward
-        risk_reward = self._extract_field(section, r'(?:Risk[- ]Reward|R:R|RR):?\s*(.+?)(?:\n|,|;|$)')
-        
-        # Extract position sizing
-        position_sizing = self._extract_field(section, r'(?:Position Siz|Risk):?\s*(.+?)(?:\n|$)')
-        
-        # Extract timeframe
-        timeframe_context = self._extract_field(section, r'(?:Timeframe|Time Frame|Best for):?\s*(.+?)(?:\n|$)')
-        
-        # Extract confidence
-        confidence = self._extract_field(section, r'(?:Confidence|Probability):?\s*(.+?)(?:\n|$)')
+        # Extract targets, risk-reward, sizing, timeframe and confidence
+        fields = {
+            name: self._extract_field(section, pattern)
+            for name, pattern in _TRADING_FIELDS
+        }
         
         return TradingSignals(
             signal_type=signal_type,
             entry_level=entry_level or "See market structure section",
             stop_loss=stop_loss or "See invalidation conditions",
-            take_profit_1=take_profit_1 or "See key resistance/support levels",
-            take_profit_2=take_profit_2,
-            risk_reward_ratio=risk_reward or "Monitor 1:2 minimum",
-            position_sizing=position_sizing or "Risk 1-2% of capital per trade",
-            timeframe_context=timeframe_context,
-            confidence_score=confidence
+            take_profit_1=fields["take_profit_1"] or "See key resistance/support levels",
+            take_profit_2=fields["take_profit_2"],
+            risk_reward_ratio=fields["risk_reward_ratio"] or "Monitor 1:2 minimum",
+            position_sizing=fields["position_sizing"] or "Risk 1-2% of capital per trade",
+            timeframe_context=fields["timeframe_context"],
+            confidence_score=fields["confidence_score"]
         )
     
-    def _generate_signals_from_bias(self, text: str) -> TradingSignals:
+    def _generate_signals_from_bias(self, text: str, text_lower: str) -> TradingSignals:
         """Generate basic signals from strategy bias when no explicit signals section"""
         # Extract bias from text
         signal_type = "WAIT"
-        if "strong" in text.lower() and "bullish" in text.lower():
+        if "strong" in text_lower and "bullish" in text_lower:
             signal_type = "BUY"
-        elif "strong" in text.lower() and "bearish" in text.lower():
+        elif "strong" in text_lower and "bearish" in text_lower:
             signal_type = "SELL"
-        elif "bullish" in text.lower() and "high" in text.lower():
+        elif "bullish" in text_lower and "high" in text_lower:
             signal_type = "BUY"
-        elif "bearish" in text.lower() and "high" in text.lower():
+        elif "bearish" in text_lower and "high" in text_lower:
             signal_type = "SELL"
         
         return TradingSignals(
@@ -683,91 +1019,99 @@ class ResponseParser:
             confidence_score="See Strategy Bias section"
         )
     
-    def _parse_risks(self, text: str) -> RiskConsiderations:
+    def _parse_risks(self, text: str, text_lower: str, section: str) -> RiskConsiderations:
         """Parse risk considerations section"""
-        section = self._extract_section_by_pattern(text, self.SECTION_PATTERNS.get('risks', r'(?:\*\*)?(?:8\.?\s*)?Risk Considerations?(?:\*\*)?'))
         
         # Fallback: look anywhere in text for risk-related content
         if not section or len(section) < 20:
-            risk_keywords = ['risk', 'caution', 'uncertainty', 'monitor']
-            for keyword in risk_keywords:
-                if keyword in text.lower():
-                    pattern = rf'(.{{0,400}}{keyword}.{{0,400}})'
-                    match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-                    if match:
-                        section = match.group(1).strip()
-                        break
+            for keyword in _RISK_KEYWORDS:
+                window = _keyword_window(text, text_lower, keyword, 400)
+                if window:
+                    section = text[window[0]:window[1]].strip()
+                    break
         
         # Extract risks with improved patterns
         risks = []
         if section:
             # Try specific risk patterns first
-            risk_patterns = [
-                r'[-•*]\s*(.+?)(?:\n|$)',  # Bullet points
-                r'(?:Risk|Caution|Warning):?\s*(.+?)(?:\n|$)',
-                r'(?:may|could|might)\s+(.+?)(?:\n|$)',  # Uncertainty language
-            ]
-            risks = self._extract_list_items(section, patterns=risk_patterns)
+            risks = self._extract_list_items(section, pattern=_RISK_LIST_RE)
         
         # Extract conflicting signals
         conflicting = []
-        if section:
-            conflicting_patterns = [
-                r'(?:Conflict|Conflicting|Divergence):?\s*(.+?)(?:\n|$)',
-                r'(?:however|but|although)\s+(.+?)(?:\n|$)',
-            ]
-            conflicting = self._extract_list_items(section, patterns=conflicting_patterns)
+        if section and any(trigger in section for trigger in _CONFLICTING_TRIGGERS):
+            conflicting = self._extract_list_items(section, pattern=_CONFLICTING_LIST_RE)
         
         # Extract monitoring points
         monitoring = []
-        if section:
-            monitoring_patterns = [
-                r'(?:Monitor|Watch|Track|Check):?\s*(.+?)(?:\n|$)',
-                r'(?:key level|important level):?\s*(.+?)(?:\n|$)',
-            ]
-            monitoring = self._extract_list_items(section, patterns=monitoring_patterns)
+        if section and any(trigger in section for trigger in _MONITORING_TRIGGERS):
+            monitoring = self._extract_list_items(section, pattern=_MONITORING_LIST_RE)
         
         # Extract uncertainty note
         uncertainty = None
         if section:
-            uncertainty = self._extract_field(section, r'(?:Uncertainty|Acknowledgment|Disclaimer):?\s*(.+?)(?:\n\n|$)')
+            uncertainty = (match := _UNCERTAINTY_RE.search(section)) and match.group(1).strip()
         
         # Smart defaults
         if not risks:
-            risks = ["Market volatility risk", "Timing risk", "External factors may impact outcome"]
+            risks = list(_DEFAULT_RISKS)
         
         if not monitoring:
-            monitoring = ["Price action at key levels", "Volume confirmation", "Overall market conditions"]
+            monitoring = list(_DEFAULT_MONITORING)
         
         return RiskConsiderations(
             risks=risks[:5],
             conflicting_signals=conflicting[:3],
             monitoring_points=monitoring[:5],
-            uncertainty_note=uncertainty or "Markets are inherently uncertain. This analysis is for educational purposes only."
+            uncertainty_note=uncertainty or _DEFAULT_UNCERTAINTY_NOTE
         )
     
     # Helper methods
     
     def _extract_section(self, text: str, header: str) -> str:
         """Extract section by header name"""
-        pattern = rf'{header}:?\s*\n(.+?)(?=\n\n|\n[A-Z]|\Z)'
-        match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+        match = _compile_section(header).search(text)
         return match.group(1).strip() if match else ""
     
-    def _extract_section_by_pattern(self, text: str, pattern: str) -> str:
-        """Extract section by regex pattern - more flexible matching"""
-        # Try multiple pattern variations
-        patterns_to_try = [
-            # Match with markdown headers or numbered sections
-            pattern + r':?\s*\n+(.+?)(?=\n+(?:\*\*)?(?:\d+\.|\#\#)|\Z)',
-            # Match inline without newline requirement
-            pattern + r':?\s*(.+?)(?=\n+(?:\*\*)?(?:\d+\.|\#\#)|\Z)',
-            # Simpler fallback
-            pattern + r'(.+?)(?=\n\n|\Z)',
-        ]
-        
-        for p in patterns_to_try:
-            match = re.search(p, text, re.DOTALL | re.IGNORECASE)
+    def _split_sections(self, text: str, text_lower: str) -> Dict[str, str]:
+        """
+        Extract the body of every reasoning section.
+        
+        A single scan of the lowercased text records where each section
+        keyword first appears; body patterns then search from that offset
+        only, and sections whose keyword never appears are skipped.
+        
+        Args:
+            text: Raw reasoning output
+            text_lower: Lowercased copy of text
+            
+        Returns:
+            Mapping of section name to body ("" when not found)
+        """
+        offsets = _section_keyword_offsets(text_lower)
+        # Offsets are only valid in text when lower() kept its length (e.g. 'İ'
+        # lowers to two characters); otherwise present sections search from 0
+        same_length = len(text_lower) == len(text)
+        
+        sections = {}
+        for name, keyword in _SECTION_KEYWORDS.items():
+            pos = offsets.get(keyword)
+            if pos is not None and not same_length:
+                pos = 0
+            sections[name] = (
+                self._extract_section_by_pattern(text, self.SECTION_BODY_PATTERNS[name], pos)
+                if pos is not None else ""
+            )
+        return sections
+    
+    def _extract_section_by_pattern(self, text: str, patterns: tuple, pos: int = 0) -> str:
+        """
+        Extract section using precompiled body patterns - more flexible matching.
+        
+        Patterns are tried from strictest to loosest (see _section_body_patterns),
+        searching from pos onwards.
+        """
+        for p in patterns:
+            match = p.search(text, pos)
             if match:
                 content = match.group(1).strip()
                 if content and len(content) > 10:  # Valid content threshold
@@ -777,94 +1121,47 @@ class ResponseParser:
     
     def _extract_subsection(self, text: str, pattern: str) -> str:
         """Extract subsection within a section"""
-        match = re.search(pattern + r':?\s*\n(.+?)(?=\n\*\*|\n##|\Z)', text, re.DOTALL | re.IGNORECASE)
+        match = _compile_cached(pattern + r':?\s*\n(.+?)(?=\n\*\*|\n##|\Z)', re.DOTALL | re.IGNORECASE).search(text)
         return match.group(1).strip() if match else ""
     
-    def _extract_field(self, text: str, pattern: str) -> Optional[str]:
-        """Extract single field value"""
-        match = re.search(pattern, text, re.IGNORECASE)
+    def _extract_field(self, text: str, pattern) -> Optional[str]:
+        """Extract single field value (pattern may be a string or precompiled)"""
+        if isinstance(pattern, str):
+            match = _compile_cached(pattern, re.IGNORECASE).search(text)
+        else:
+            match = pattern.search(text)
         return match.group(1).strip() if match else None
     
     def _extract_first_paragraph(self, text: str) -> str:
         """Extract first paragraph from text"""
-        paragraphs = text.split('\n\n')
-        return paragraphs[0].strip() if paragraphs else ""
+        first, _, _ = text.partition('\n\n')
+        return first.strip()
     
-    def _extract_list_items(self, text: str, patterns: List[str] = None) -> List[str]:
-        """Extract list items from text"""
-        items = []
-        
-        # Default pattern: bullet points and numbered lists
-        default_patterns = [
-            r'[-•*]\s*(.+?)(?:\n|$)',
-            r'\d+\.\s*(.+?)(?:\n|$)'
-        ]
-        
-        patterns = patterns or default_patterns
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, text, re.MULTILINE)
-            for match in matches:
-                item = match.group(1).strip()
-                # Clean up markdown bold
-                item = re.sub(r'\*\*(.+?)\*\*', r'\1', item)
-                if item and len(item) > 3:  # Filter out very short items
-                    items.append(item)
+    def _extract_list_items(self, text: str, pattern=None) -> List[str]:
+        """
+        Extract list items from text in a single scan.
         
-        return list(dict.fromkeys(items))  # Remove duplicates while preserving order
+        The pattern is an alternation of item forms (default: bullet points
+        and numbered lists); exactly one non-empty group participates in
+        each match, so joining findall's group tuple yields the item.
+        """
+        items = []
+        seen = set()
+        
+        for groups in (pattern or _LIST_ITEM_RE).findall(text):
+            item = ''.join(groups).strip()
+            # Clean up markdown bold
+            item = _BOLD_RE.sub(r'\1', item)
+            # Filter out very short items and duplicates, preserving order
+            if len(item) > 3 and item not in seen:
+                seen.add(item)
+                items.append(item)
+        
+        return items
     
     def _get_fallback_reasoning(self, raw_output: str) -> ReasoningAnalysis:
         """Return fallback structure when parsing fails"""
-        return ReasoningAnalysis(
-            market_structure=MarketStructure(
-                trend_description="Analysis unavailable",
-                key_levels=["Parsing error"],
-                structural_notes=[]
-            ),
-            momentum=MomentumAnalysis(
-                assessment="Analysis unavailable",
-                indicators=[],
-                divergences=[],
-                strength="Unknown"
-            ),
-            regime=RegimeClassification(
-                regime="Indecisive",
-                reasoning="Parsing error",
-                volatility="Unknown"
-            ),
-            strategy_bias=StrategyBiasAnalysis(
-                bias="Neutral",
-                confidence="Low",
-                reasoning=["Analysis unavailable due to parsing error"]
-            ),
-            suitable_approaches=SuitableApproaches(
-                approaches=[{"name": "Wait-and-see", "rationale": "Analysis unavailable"}],
-                recommended="Wait-and-see"
-            ),
-            invalidation=InvalidationConditions(
-                bullish_invalidation=["Not available"],
-                bearish_invalidation=["Not available"],
-                key_levels=["Not available"]
-            ),
-            trading_signals=TradingSignals(
-                signal_type="WAIT",
-                entry_level="Not available",
-                stop_loss="Not available",
-                take_profit_1="Not available",
-                take_profit_2=None,
-                risk_reward_ratio="Not available",
-                position_sizing="Not available",
-                timeframe_context=None,
-                confidence_score="Not available"
-            ),
-            risks=RiskConsiderations(
-                risks=["Analysis unavailable"],
-                conflicting_signals=[],
-                monitoring_points=[],
-                uncertainty_note="Parsing error occurred"
-            ),
-            raw_output=raw_output
-        )
+        return replace(_FALLBACK_REASONING, raw_output=raw_output)
     
     def to_dict(self, analysis: CompleteAnalysis) -> Dict[str, Any]:
         """
@@ -874,9 +1171,10 @@ class ResponseParser:
             analysis: CompleteAnalysis object
             
         Returns:
-            Dictionary representation
+            Dictionary representation (lists and dicts are shared with
+            the analysis, not copied)
         """
-        return asdict(analysis)
+        return _result_to_dict(analysis)
     
     def to_streamlit_format(self, analysis: CompleteAnalysis) -> Dict[str, Any]:
         """
@@ -888,59 +1186,84 @@ class ResponseParser:
         Returns:
             Dictionary optimized for Streamlit rendering
         """
+        vision = analysis.vision
+        reasoning = analysis.reasoning
+        structure = reasoning.market_structure
+        momentum = reasoning.momentum
+        regime = reasoning.regime
+        bias = reasoning.strategy_bias
+        approaches = reasoning.suitable_approaches
+        invalidation = reasoning.invalidation
+        risks = reasoning.risks
+        
         return {
             "vision": {
                 "chart_info": {
-                    "type": analysis.vision.chart_type,
-                    "timeframe": analysis.vision.timeframe or "Not specified"
+                    "type": vision.chart_type,
+                    "timeframe": vision.timeframe or "Not specified"
                 },
-                "price_structure": analysis.vision.price_structure,
-                "indicators": analysis.vision.indicators_detected,
-                "patterns": analysis.vision.visual_patterns,
-                "momentum": analysis.vision.momentum_signals
+                "price_structure": vision.price_structure,
+                "indicators": vision.indicators_detected,
+                "patterns": vision.visual_patterns,
+                "momentum": vision.momentum_signals
             },
             "analysis": {
                 "market_structure": {
-                    "trend": analysis.reasoning.market_structure.trend_description,
-                    "key_levels": analysis.reasoning.market_structure.key_levels,
-                    "notes": analysis.reasoning.market_structure.structural_notes
+                    "trend": structure.trend_description,
+                    "key_levels": structure.key_levels,
+                    "notes": structure.structural_notes
                 },
                 "momentum": {
-                    "assessment": analysis.reasoning.momentum.assessment,
-                    "indicators": analysis.reasoning.momentum.indicators,
-                    "divergences": analysis.reasoning.momentum.divergences,
-                    "strength": analysis.reasoning.momentum.strength
+                    "assessment": momentum.assessment,
+                    "indicators": momentum.indicators,
+                    "divergences": momentum.divergences,
+                    "strength": momentum.strength
                 },
                 "regime": {
-                    "classification": analysis.reasoning.regime.regime,
-                    "reasoning": analysis.reasoning.regime.reasoning,
-                    "volatility": analysis.reasoning.regime.volatility
+                    "classification": regime.regime,
+                    "reasoning": regime.reasoning,
+                    "volatility": regime.volatility
                 },
                 "strategy_bias": {
-                    "bias": analysis.reasoning.strategy_bias.bias,
-                    "confidence": analysis.reasoning.strategy_bias.confidence,
-                    "reasoning": analysis.reasoning.strategy_bias.reasoning
+                    "bias": bias.bias,
+                    "confidence": bias.confidence,
+                    "reasoning": bias.reasoning
                 },
                 "approaches": {
-                    "options": analysis.reasoning.suitable_approaches.approaches,
-                    "recommended": analysis.reasoning.suitable_approaches.recommended
+                    "options": approaches.approaches,
+                    "recommended": approaches.recommended
                 },
                 "invalidation": {
-                    "bullish": analysis.reasoning.invalidation.bullish_invalidation,
-                    "bearish": analysis.reasoning.invalidation.bearish_invalidation,
-                    "key_levels": analysis.reasoning.invalidation.key_levels
+                    "bullish": invalidation.bullish_invalidation,
+                    "bearish": invalidation.bearish_invalidation,
+                    "key_levels": invalidation.key_levels
                 },
                 "risks": {
-                    "risks": analysis.reasoning.risks.risks,
-                    "conflicts": analysis.reasoning.risks.conflicting_signals,
-                    "monitor": analysis.reasoning.risks.monitoring_points,
-                    "uncertainty": analysis.reasoning.risks.uncertainty_note
+                    "risks": risks.risks,
+                    "conflicts": risks.conflicting_signals,
+                    "monitor": risks.monitoring_points,
+                    "uncertainty": risks.uncertainty_note
                 }
             },
             "metadata": analysis.metadata
         }
 
 
+# Parsing is a pure function of the raw text, so results are shared across
+# parser instances (retries and repeated renders re-parse identical outputs)
+_CACHE_PARSER = ResponseParser()
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_vision_cached(raw_output: str) -> VisionAnalysis:
+    return _CACHE_PARSER._parse_vision(raw_output)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_reasoning_cached(raw_output: str) -> ReasoningAnalysis:
+    return _CACHE_PARSER._parse_reasoning(raw_output)
+
+
 # Convenience function
 def parse_complete_analysis(
     vision_output: str,
@@ -60,8 +60,8 @@ class CharteredApp:
         try:
             # Load image
             logger.info(f"Loading image: {image_path}")
-            with open(image_path, 'rb') as f:
-                image_bytes = f.read()
+            # read_bytes() presizes from fstat and keeps reading until EOF
+            image_bytes = Path(image_path).read_bytes()
             
             # Analyze
             return self.analyze_chart(image_bytes, timeframe, asset)
@@ -145,18 +145,24 @@ class CharteredApp:
 
 def main():
     """Main entry point for CLI usage"""
-    print("="*60)
-    print("Chartered - AI-Powered Chart Analysis")
-    print("="*60)
+    # Output is collected per block and written in one call
+    out = [
+        "="*60,
+        "Chartered - AI-Powered Chart Analysis",
+        "="*60,
+    ]
     
     # Check arguments
     if len(sys.argv) < 2:
-        print("\nUsage: python main.py <path_to_chart_image> [timeframe] [asset]")
-        print("\nExamples:")
-        print("  python main.py chart.png")
-        print("  python main.py chart.png 4H")
-        print("  python main.py chart.png 4H BTC/USD")
-        print("\n")
+        out += [
+            "\nUsage: python main.py <path_to_chart_image> [timeframe] [asset]",
+            "\nExamples:",
+            "  python main.py chart.png",
+            "  python main.py chart.png 4H",
+            "  python main.py chart.png 4H BTC/USD",
+            "\n",
+        ]
+        sys.stdout.write("\n".join(out) + "\n")
         return 1
     
     image_path = sys.argv[1]
@@ -167,80 +173,84 @@ def main():
     app = CharteredApp()
     
     # Analyze
-    print(f"\n📊 Analyzing: {Path(image_path).name}")
+    out.append(f"\n📊 Analyzing: {Path(image_path).name}")
     if timeframe:
-        print(f"⏰ Timeframe: {timeframe}")
+        out.append(f"⏰ Timeframe: {timeframe}")
     if asset:
-        print(f"💰 Asset: {asset}")
-    print()
+        out.append(f"💰 Asset: {asset}")
+    out.append("")
+    
+    # Show progress before the (slow) analysis starts
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
     
     result = app.analyze_chart_from_file(image_path, timeframe, asset)
     
     # Display results
-    print("\n" + "="*60)
-    print("ANALYSIS RESULTS")
-    print("="*60)
+    out = [
+        "\n" + "="*60,
+        "ANALYSIS RESULTS",
+        "="*60,
+    ]
     
     if result["success"]:
-        print("\n✅ Analysis Complete\n")
+        out.append("\n✅ Analysis Complete\n")
         
         analysis = result["analysis"]
         
         # Vision summary
         vision = analysis.get("vision", {})
-        print("📊 Chart Information:")
+        out.append("📊 Chart Information:")
         chart_info = vision.get("chart_info", {})
-        print(f"  Type: {chart_info.get('type', 'Unknown')}")
-        print(f"  Timeframe: {chart_info.get('timeframe', 'Not specified')}")
+        out.append(f"  Type: {chart_info.get('type', 'Unknown')}")
+        out.append(f"  Timeframe: {chart_info.get('timeframe', 'Not specified')}")
         
         # Indicators
         indicators = vision.get("indicators", [])
         if indicators:
-            print(f"\n  Indicators ({len(indicators)}):")
-            for ind in indicators[:3]:
-                print(f"    - {ind}")
+            out.append(f"\n  Indicators ({len(indicators)}):")
+            out += [f"    - {ind}" for ind in indicators[:3]]
             if len(indicators) > 3:
-                print(f"    ... and {len(indicators) - 3} more")
+                out.append(f"    ... and {len(indicators) - 3} more")
         
         # Strategy bias
         reasoning = analysis.get("analysis", {})
         bias_data = reasoning.get("strategy_bias", {})
         if bias_data:
-            print(f"\n🎯 Strategy Bias:")
-            print(f"  {bias_data.get('bias', 'N/A')} (Confidence: {bias_data.get('confidence', 'N/A')})")
+            out.append(f"\n🎯 Strategy Bias:")
+            out.append(f"  {bias_data.get('bias', 'N/A')} (Confidence: {bias_data.get('confidence', 'N/A')})")
         
         # Market regime
         regime = reasoning.get("regime", {})
         if regime:
-            print(f"\n📈 Market Regime:")
-            print(f"  {regime.get('classification', 'N/A')}")
+            out.append(f"\n📈 Market Regime:")
+            out.append(f"  {regime.get('classification', 'N/A')}")
         
         # Approaches
         approaches = reasoning.get("approaches", {})
         if approaches and approaches.get("options"):
-            print(f"\n💡 Suggested Approaches ({len(approaches['options'])}):")
+            out.append(f"\n💡 Suggested Approaches ({len(approaches['options'])}):")
             for approach in approaches["options"][:2]:
                 marker = " ⭐" if approach["name"] == approaches.get("recommended") else ""
-                print(f"  - {approach['name']}{marker}")
+                out.append(f"  - {approach['name']}{marker}")
         
         # Warnings
         if result["warnings"]:
-            print(f"\n⚠️  Warnings:")
-            for warning in result["warnings"]:
-                print(f"  - {warning}")
+            out.append(f"\n⚠️  Warnings:")
+            out += [f"  - {warning}" for warning in result["warnings"]]
         
-        print("\n💡 Tip: Use the Streamlit frontend for full interactive analysis")
+        out.append("\n💡 Tip: Use the Streamlit frontend for full interactive analysis")
         
     else:
-        print("\n❌ Analysis Failed\n")
-        print(result["error"])
+        out.append("\n❌ Analysis Failed\n")
+        out.append(str(result["error"]))
         
         if result["warnings"]:
-            print(f"\n⚠️  Additional Information:")
-            for warning in result["warnings"]:
-                print(f"  - {warning}")
+            out.append(f"\n⚠️  Additional Information:")
+            out += [f"  - {warning}" for warning in result["warnings"]]
     
-    print("\n" + "="*60)
+    out.append("\n" + "="*60)
+    sys.stdout.write("\n".join(out) + "\n")
     return 0 if result["success"] else 1
 
 
@@ -8,6 +8,8 @@ Author: Chartered
 Version: 1.0.0
 """
 
+from functools import lru_cache
+
 # ============================================================================
 # VISION MODEL PROMPTS
 # ============================================================================
@@ -23,15 +25,14 @@ Focus on:
 4. Visual Patterns - formations or patterns
 5. Momentum Signals - what indicators show
 
-{context_section}
-
-Be factual, objective, no predictions or trade suggestions. Use neutral language."""
+Be factual, objective, no predictions or trade suggestions. Use neutral language.{context_section}"""
 
+# Per-request context goes last so every request shares the static prefix
 VISION_CONTEXT_TEMPLATE = """
+
 Additional Context:
 - Timeframe: {timeframe}
-- Asset: {asset}
-"""
+- Asset: {asset}"""
 
 
 # ============================================================================
@@ -53,9 +54,8 @@ You must NEVER:
 - Make guarantees about outcomes
 - Recommend trade execution"""
 
-REASONING_USER_PROMPT_TEMPLATE = """Analyze this chart description and provide structured insights:
-
-{vision_output}
+# The vision output goes last so the instructions form a stable prompt prefix
+REASONING_USER_PROMPT_TEMPLATE = """Analyze the chart description below and provide structured insights.
 
 ## Required Analysis Sections
 
@@ -84,13 +84,21 @@ REASONING_USER_PROMPT_TEMPLATE = """Analyze this chart description and provide s
 
 **8. Risks** - Key uncertainties, conflicting signals, what to monitor
 
-Be concise, specific, use probabilistic language. Provide numbers when available."""
+Be concise, specific, use probabilistic language. Provide numbers when available.
+
+## Chart Description
+
+{vision_output}"""
 
 
 # ============================================================================
 # COMBINED PROMPT BUILDER
 # ============================================================================
 
+# Vision prompt without chart context, built once at import
+_DEFAULT_VISION_PROMPT = VISION_USER_PROMPT_TEMPLATE.format(context_section="")
+
+
 def build_vision_prompt(context: dict = None) -> str:
     """
     Build vision model prompt with optional context.
@@ -102,13 +110,18 @@ def build_vision_prompt(context: dict = None) -> str:
         Formatted vision prompt
     """
     if context and (context.get('timeframe') or context.get('asset')):
-        context_section = VISION_CONTEXT_TEMPLATE.format(
-            timeframe=context.get('timeframe', 'Not specified'),
-            asset=context.get('asset', 'Not specified')
+        return _format_vision_prompt(
+            context.get('timeframe', 'Not specified'),
+            context.get('asset', 'Not specified')
         )
-    else:
-        context_section = ""
     
+    return _DEFAULT_VISION_PROMPT
+
+
+@lru_cache(maxsize=64)
+def _format_vision_prompt(timeframe: str, asset: str) -> str:
+    """Format the vision prompt for one timeframe/asset pair (cached)"""
+    context_section = VISION_CONTEXT_TEMPLATE.format(timeframe=timeframe, asset=asset)
     return VISION_USER_PROMPT_TEMPLATE.format(context_section=context_section)
 
 
@@ -118,14 +131,26 @@ def build_reasoning_prompt(vision_output: str, context: dict = None) -> str:
     
     Args:
         vision_output: Output from vision model
-        context: Optional additional context
+        context: Optional additional context (currently unused)
         
     Returns:
         Formatted reasoning prompt
     """
+    return _format_reasoning_prompt(vision_output)
+
+
+@lru_cache(maxsize=64)
+def _format_reasoning_prompt(vision_output: str) -> str:
+    """Format the reasoning prompt for one vision output (cached)"""
     return REASONING_USER_PROMPT_TEMPLATE.format(vision_output=vision_output)
 
 
+# Chat-format envelopes around the reasoning prompt, built once at import
+_LLAMA_PREFIX = f"<s>[INST] <<SYS>>\n{REASONING_SYSTEM_PROMPT}\n<</SYS>>\n\n"
+_MISTRAL_PREFIX = "<s>[INST] "
+_INST_SUFFIX = " [/INST]"
+
+
 def build_llama_prompt(vision_output: str) -> str:
     """
     Build Llama-2 formatted prompt with special tokens.
@@ -136,13 +161,7 @@ def build_llama_prompt(vision_output: str) -> str:
     Returns:
         Llama-2 formatted prompt
     """
-    user_prompt = build_reasoning_prompt(vision_output)
-    
-    return f"""<s>[INST] <<SYS>>
-{REASONING_SYSTEM_PROMPT}
-<</SYS>>
-
-{user_prompt} [/INST]"""
+    return _LLAMA_PREFIX + build_reasoning_prompt(vision_output) + _INST_SUFFIX
 
 
 def build_mistral_prompt(vision_output: str) -> str:
@@ -155,9 +174,7 @@ def build_mistral_prompt(vision_output: str) -> str:
     Returns:
         Mistral formatted prompt
     """
-    user_prompt = build_reasoning_prompt(vision_output)
-    
-    return f"""<s>[INST] {user_prompt} [/INST]"""
+    return _MISTRAL_PREFIX + build_reasoning_prompt(vision_output) + _INST_SUFFIX
 
 
 # ============================================================================
@@ -14,7 +14,13 @@ Author: Chartered
 Version: 1.0.0
 """
 
+import hashlib
+import json
 import logging
+import re
+import threading
+from collections import OrderedDict
+from functools import cached_property
 from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from io import BytesIO
@@ -32,11 +38,24 @@ from backend.config import (
     REASONING_TIMEOUT,
     MAX_RETRIES,
     RETRY_DELAY,
-    HF_API_KEY
+    HF_API_KEY,
+    ENABLE_CACHING,
+    RESPONSE_CACHE_SIZE
 )
 
 logger = logging.getLogger(__name__)
 
+# Context keys accepted from callers
+_ALLOWED_CONTEXT_KEYS = frozenset({'timeframe', 'asset', 'description'})
+
+# Characters outside alphanumerics, spaces, and common trading symbols
+_CONTEXT_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9\s\-_/.,():]')
+
+
+def _digest(data: bytes) -> str:
+    """Short BLAKE2b hex digest used for cache keys"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
 
 @dataclass
 class AnalysisResult:
@@ -64,7 +83,8 @@ class ChartAnalysisOrchestrator:
         self,
         vision_model: str = VISION_MODEL,
         reasoning_model: str = REASONING_MODEL,
-        strict_safety: bool = True
+        strict_safety: bool = True,
+        enable_cache: bool = ENABLE_CACHING
     ):
         """
         Initialize orchestrator.
@@ -73,29 +93,53 @@ class ChartAnalysisOrchestrator:
             vision_model: Vision model ID
             reasoning_model: Reasoning model ID
             strict_safety: Whether to use strict safety mode
+            enable_cache: Whether to reuse results for repeated image/context pairs
         """
         self.logger = logging.getLogger(__name__)
         
-        # Initialize components
+        # Initialize components (model clients are created on first use)
+        self.vision_model = vision_model
+        self.reasoning_model = reasoning_model
+        # Llama models get their chat envelope; others take the plain prompt
+        if "llama" in reasoning_model.lower():
+            self._reasoning_prompt_builder = build_llama_prompt
+        else:
+            self._reasoning_prompt_builder = build_reasoning_prompt
         self.image_processor = ImageProcessor()
-        self.vision_client = create_vision_client(
+        self.response_parser = ResponseParser()
+        self.safety_validator = SafetyValidator(strict_mode=strict_safety)
+        
+        # LRUs of successful results and of each model stage's output, so a
+        # run that fails after vision still reuses the vision call on retry
+        self.enable_cache = enable_cache
+        self._response_cache: "OrderedDict[str, AnalysisResult]" = OrderedDict()
+        self._vision_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._reasoning_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        self.logger.info(f"Orchestrator initialized with vision={vision_model}, reasoning={reasoning_model}")
+    
+    @cached_property
+    def vision_client(self) -> HuggingFaceClient:
+        """Vision model client, created on first use"""
+        return create_vision_client(
             api_key=HF_API_KEY,
-            model_id=vision_model,
+            model_id=self.vision_model,
             timeout=VISION_TIMEOUT,
             max_retries=MAX_RETRIES,
             retry_delay=RETRY_DELAY
         )
-        self.reasoning_client = create_text_client(
+    
+    @cached_property
+    def reasoning_client(self) -> HuggingFaceClient:
+        """Reasoning model client, created on first use"""
+        return create_text_client(
             api_key=HF_API_KEY,
-            model_id=reasoning_model,
+            model_id=self.reasoning_model,
             timeout=REASONING_TIMEOUT,
             max_retries=MAX_RETRIES,
             retry_delay=RETRY_DELAY
         )
-        self.response_parser = ResponseParser()
-        self.safety_validator = SafetyValidator(strict_mode=strict_safety)
-        
-        self.logger.info(f"Orchestrator initialized with vision={vision_model}, reasoning={reasoning_model}")
     
     def analyze_chart(
         self,
@@ -110,17 +154,26 @@ class ChartAnalysisOrchestrator:
             context: Optional context (timeframe, asset, etc.)
             
         Returns:
-            AnalysisResult with success status and data
+            AnalysisResult with success status and data (cached results are
+            shared between calls and must not be mutated)
         """
         context = context or {}
         
         # Sanitize context inputs to prevent injection attacks
         sanitized_context = self._sanitize_context(context)
         
+        cache_key = None
+        if self.enable_cache:
+            cache_key = self._input_cache_key(image_bytes, sanitized_context)
+            cached = self._cache_get(self._response_cache, cache_key)
+            if cached is not None:
+                self.logger.info("Returning cached analysis")
+                return cached
+        
         warnings = []
         metadata = {
-            "vision_model": self.vision_client.config.model_id,
-            "reasoning_model": self.reasoning_client.config.model_id,
+            "vision_model": self.vision_model,
+            "reasoning_model": self.reasoning_model,
             **sanitized_context
         }
         
@@ -132,7 +185,7 @@ class ChartAnalysisOrchestrator:
             
             # Step 2: Vision analysis
             self.logger.info("Step 2/5: Running vision analysis")
-            vision_output = self._run_vision_analysis(processed_image, sanitized_context)
+            vision_output = self._run_vision_analysis(processed_image, sanitized_context, cache_key)
             
             # Step 3: Reasoning analysis
             self.logger.info("Step 3/5: Running reasoning analysis")
@@ -158,13 +211,16 @@ class ChartAnalysisOrchestrator:
                 )
             
             self.logger.info("Analysis completed successfully")
-            return AnalysisResult(
+            result = AnalysisResult(
                 success=True,
                 analysis=safe_analysis,
                 error_message=None,
                 warnings=warnings,
                 metadata=metadata
             )
+            if cache_key is not None:
+                self._cache_put(self._response_cache, cache_key, result, RESPONSE_CACHE_SIZE)
+            return result
             
         except Exception as e:
             self.logger.error(f"Analysis failed: {str(e)}", exc_info=True)
@@ -176,6 +232,27 @@ class ChartAnalysisOrchestrator:
                 metadata=metadata
             )
     
+    @staticmethod
+    def _input_cache_key(image_bytes: bytes, context: Dict[str, str]) -> str:
+        """Build the cache key for an image and its sanitized context"""
+        return _digest(image_bytes) + "|" + json.dumps(context, sort_keys=True)
+    
+    def _cache_get(self, cache: OrderedDict, key: str) -> Any:
+        """Look up a cache entry, marking it most recently used"""
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+    
+    def _cache_put(self, cache: OrderedDict, key: str, value: Any, maxsize: int) -> None:
+        """Store a cache entry, evicting the least recently used beyond maxsize"""
+        with self._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            while len(cache) > maxsize:
+                cache.popitem(last=False)
+    
     def _preprocess_image(self, image_bytes: bytes) -> Tuple[bytes, Dict[str, Any]]:
         """
         Preprocess chart image.
@@ -202,23 +279,39 @@ class ChartAnalysisOrchestrator:
             self.logger.error(f"Image preprocessing failed: {str(e)}")
             raise ValueError(f"Image preprocessing failed: {str(e)}")
     
-    def _run_vision_analysis(self, image_bytes: bytes, context: Dict[str, str]) -> str:
+    def _run_vision_analysis(
+        self,
+        image_bytes: bytes,
+        context: Dict[str, str],
+        cache_key: Optional[str] = None
+    ) -> str:
         """
         Run vision model analysis.
         
         Args:
             image_bytes: Processed image bytes
             context: Analysis context
+            cache_key: Key of the raw image and context, if already computed
             
         Returns:
             Vision model output text
         """
+        if self.enable_cache:
+            # Preprocessing is deterministic, so the raw image key identifies
+            # the processed image too and saves hashing it again
+            if cache_key is None:
+                cache_key = self._input_cache_key(image_bytes, context)
+            cached = self._cache_get(self._vision_cache, cache_key)
+            if cached is not None:
+                self.logger.info("Using cached vision analysis")
+                return cached
+        
         try:
             # Build vision prompt
             vision_prompt = build_vision_prompt(context)
             
             # Query vision model
-            self.logger.info(f"Querying vision model: {self.vision_client.config.model_id}")
+            self.logger.info("Querying vision model: %s", self.vision_model)
             vision_result = self.vision_client.query_vision_model(
                 image=image_bytes,
                 prompt=vision_prompt
@@ -229,7 +322,9 @@ class ChartAnalysisOrchestrator:
                 self.logger.warning(f"Vision model returned non-string type: {type(vision_result)}")
                 vision_result = str(vision_result)
             
-            self.logger.info(f"Vision analysis complete ({len(vision_result)} chars)")
+            self.logger.info("Vision analysis complete (%d chars)", len(vision_result))
+            if cache_key is not None:
+                self._cache_put(self._vision_cache, cache_key, vision_result, RESPONSE_CACHE_SIZE)
             return vision_result
             
         except Exception as e:
@@ -246,21 +341,27 @@ class ChartAnalysisOrchestrator:
         Returns:
             Reasoning model output text
         """
+        cache_key = None
+        if self.enable_cache:
+            cache_key = _digest(vision_output.encode())
+            cached = self._cache_get(self._reasoning_cache, cache_key)
+            if cached is not None:
+                self.logger.info("Using cached reasoning analysis")
+                return cached
+        
         try:
-            # Build reasoning prompt
-            reasoning_prompt = build_reasoning_prompt(vision_output)
-            
-            # Format for specific model if needed
-            if "llama" in self.reasoning_client.config.model_id.lower():
-                reasoning_prompt = build_llama_prompt(vision_output)
+            # Build reasoning prompt in the model's format
+            reasoning_prompt = self._reasoning_prompt_builder(vision_output)
             
             # Query reasoning model
-            self.logger.info(f"Querying reasoning model: {self.reasoning_client.config.model_id}")
+            self.logger.info("Querying reasoning model: %s", self.reasoning_model)
             reasoning_output = self.reasoning_client.query_text_model(
                 prompt=reasoning_prompt
             )
             
-            self.logger.info(f"Reasoning analysis complete ({len(reasoning_output)} chars)")
+            self.logger.info("Reasoning analysis complete (%d chars)", len(reasoning_output))
+            if cache_key is not None:
+                self._cache_put(self._reasoning_cache, cache_key, reasoning_output, RESPONSE_CACHE_SIZE)
             return reasoning_output
             
         except Exception as e:
@@ -382,11 +483,8 @@ class ChartAnalysisOrchestrator:
         """Sanitize context inputs to prevent injection attacks"""
         sanitized = {}
         
-        # Whitelist of allowed context keys
-        allowed_keys = {'timeframe', 'asset', 'description'}
-        
         for key, value in context.items():
-            if key not in allowed_keys:
+            if key not in _ALLOWED_CONTEXT_KEYS:
                 self.logger.warning(f"Ignoring unknown context key: {key}")
                 continue
             
@@ -400,9 +498,7 @@ class ChartAnalysisOrchestrator:
                 value = value[:200]
             
             # Remove potentially dangerous characters
-            # Allow alphanumeric, spaces, and common trading symbols
-            import re
-            value = re.sub(r'[^a-zA-Z0-9\s\-_/.,():]', '', value)
+            value = _CONTEXT_SANITIZE_RE.sub('', value)
             
             if value.strip():
                 sanitized[key] = value.strip()
@@ -414,6 +510,10 @@ class ChartAnalysisOrchestrator:
 # CONVENIENCE FUNCTIONS
 # ============================================================================
 
+# Shared by analyze_chart_simple so repeated calls reuse clients and caches
+_default_orchestrator: Optional[ChartAnalysisOrchestrator] = None
+
+
 def analyze_chart_simple(
     image_bytes: bytes,
     timeframe: Optional[str] = None,
@@ -430,7 +530,9 @@ def analyze_chart_simple(
     Returns:
         AnalysisResult
     """
-    orchestrator = ChartAnalysisOrchestrator()
+    global _default_orchestrator
+    if _default_orchestrator is None:
+        _default_orchestrator = ChartAnalysisOrchestrator()
     
     context = {}
     if timeframe:
@@ -438,7 +540,7 @@ def analyze_chart_simple(
     if asset:
         context["asset"] = asset
     
-    return orchestrator.analyze_chart(image_bytes, context)
+    return _default_orchestrator.analyze_chart(image_bytes, context)
 
 
 # ============================================================================
@@ -8,13 +8,25 @@ Version: 1.0.0
 """
 
 import time
+import threading
+from contextlib import ExitStack
+from itertools import count
 from typing import Dict, Optional
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import defaultdict, deque
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Monotonic so wall-clock adjustments cannot extend or lift a block
+_now = time.monotonic
+
+# Number of lock stripes; identifiers hash onto one stripe each
+_LOCK_STRIPES = 16
+
+# Idle identifiers are swept out every this many is_allowed calls
+_SWEEP_INTERVAL = 1024
+
 
 @dataclass
 class RateLimitConfig:
@@ -40,9 +52,18 @@ class RateLimiter:
             config: Rate limit configuration
         """
         self.config = config or RateLimitConfig()
-        self.request_log: Dict[str, list] = defaultdict(list)
+        # Request timestamps per identifier, oldest first
+        self.request_log: Dict[str, deque] = defaultdict(deque)
         self.blocked_until: Dict[str, float] = {}
         self.logger = logging.getLogger(__name__)
+        # Striped locks so concurrent checks for different identifiers
+        # rarely contend, while each identifier's check-and-append is atomic
+        self._locks = [threading.Lock() for _ in range(_LOCK_STRIPES)]
+        self._calls = count(1)
+    
+    def _lock_for(self, identifier: str) -> threading.Lock:
+        """Return the lock guarding identifier's bucket"""
+        return self._locks[hash(identifier) % _LOCK_STRIPES]
     
     def is_allowed(self, identifier: str) -> tuple[bool, Optional[str]]:
         """
@@ -54,43 +75,46 @@ class RateLimiter:
         Returns:
             Tuple of (is_allowed, reason_if_blocked)
         """
-        current_time = time.time()
-        
-        # Check if currently blocked
-        if identifier in self.blocked_until:
-            if current_time < self.blocked_until[identifier]:
-                remaining = int(self.blocked_until[identifier] - current_time)
-                self.logger.warning(f"Blocked request from {identifier}, {remaining}s remaining")
-                return False, f"Rate limit exceeded. Try again in {remaining} seconds."
-            else:
-                # Block expired, remove from blocked list
-                del self.blocked_until[identifier]
-                self.request_log[identifier] = []
+        current_time = _now()
         
-        # Clean old requests outside time window
-        cutoff_time = current_time - self.config.time_window
-        self.request_log[identifier] = [
-            req_time for req_time in self.request_log[identifier]
-            if req_time > cutoff_time
-        ]
-        
-        # Check if limit exceeded
-        if len(self.request_log[identifier]) >= self.config.max_requests:
-            # Block the identifier
-            self.blocked_until[identifier] = current_time + self.config.block_duration
-            self.logger.warning(
-                f"Rate limit exceeded for {identifier}. "
-                f"Blocked for {self.config.block_duration}s"
-            )
-            return False, (
-                f"Rate limit exceeded. Maximum {self.config.max_requests} requests "
-                f"per {self.config.time_window} seconds. "
-                f"Blocked for {self.config.block_duration} seconds."
-            )
+        if next(self._calls) % _SWEEP_INTERVAL == 0:
+            self._sweep(current_time)
         
-        # Allow request and log it
-        self.request_log[identifier].append(current_time)
-        return True, None
+        with self._lock_for(identifier):
+            # Check if currently blocked
+            if identifier in self.blocked_until:
+                if current_time < self.blocked_until[identifier]:
+                    remaining = int(self.blocked_until[identifier] - current_time)
+                    self.logger.warning(f"Blocked request from {identifier}, {remaining}s remaining")
+                    return False, f"Rate limit exceeded. Try again in {remaining} seconds."
+                else:
+                    # Block expired, remove from blocked list
+                    del self.blocked_until[identifier]
+                    self.request_log[identifier].clear()
+            
+            # Clean old requests outside time window
+            requests = self.request_log[identifier]
+            cutoff_time = current_time - self.config.time_window
+            while requests and requests[0] <= cutoff_time:
+                requests.popleft()
+            
+            # Check if limit exceeded
+            if len(requests) >= self.config.max_requests:
+                # Block the identifier
+                self.blocked_until[identifier] = current_time + self.config.block_duration
+                self.logger.warning(
+                    f"Rate limit exceeded for {identifier}. "
+                    f"Blocked for {self.config.block_duration}s"
+                )
+                return False, (
+                    f"Rate limit exceeded. Maximum {self.config.max_requests} requests "
+                    f"per {self.config.time_window} seconds. "
+                    f"Blocked for {self.config.block_duration} seconds."
+                )
+            
+            # Allow request and log it
+            requests.append(current_time)
+            return True, None
     
     def get_remaining_requests(self, identifier: str) -> int:
         """
@@ -102,17 +126,38 @@ class RateLimiter:
         Returns:
             Number of remaining requests
         """
-        current_time = time.time()
+        current_time = _now()
         cutoff_time = current_time - self.config.time_window
         
-        # Clean old requests
-        self.request_log[identifier] = [
-            req_time for req_time in self.request_log[identifier]
-            if req_time > cutoff_time
-        ]
+        with self._lock_for(identifier):
+            # Unseen identifiers have the full allowance; don't create a bucket
+            requests = self.request_log.get(identifier)
+            if requests is None:
+                return self.config.max_requests
+            
+            # Clean old requests
+            while requests and requests[0] <= cutoff_time:
+                requests.popleft()
+            
+            return max(0, self.config.max_requests - len(requests))
+    
+    def _sweep(self, current_time: float):
+        """
+        Drop identifiers with no requests in the window and no active block.
+        
+        Args:
+            current_time: Current monotonic time
+        """
+        cutoff_time = current_time - self.config.time_window
         
-        current_count = len(self.request_log[identifier])
-        return max(0, self.config.max_requests - current_count)
+        for identifier, requests in list(self.request_log.items()):
+            with self._lock_for(identifier):
+                if requests and requests[-1] > cutoff_time:
+                    continue
+                if self.blocked_until.get(identifier, 0) > current_time:
+                    continue
+                self.request_log.pop(identifier, None)
+                self.blocked_until.pop(identifier, None)
     
     def reset(self, identifier: Optional[str] = None):
         """
@@ -122,14 +167,19 @@ class RateLimiter:
             identifier: Specific identifier to reset, or None to reset all
         """
         if identifier:
-            if identifier in self.request_log:
-                del self.request_log[identifier]
-            if identifier in self.blocked_until:
-                del self.blocked_until[identifier]
+            with self._lock_for(identifier):
+                if identifier in self.request_log:
+                    del self.request_log[identifier]
+                if identifier in self.blocked_until:
+                    del self.blocked_until[identifier]
             self.logger.info(f"Rate limit reset for {identifier}")
         else:
-            self.request_log.clear()
-            self.blocked_until.clear()
+            # Hold every stripe so no is_allowed call sees a half-cleared state
+            with ExitStack() as stack:
+                for lock in self._locks:
+                    stack.enter_context(lock)
+                self.request_log.clear()
+                self.blocked_until.clear()
             self.logger.info("Rate limit reset for all identifiers")
 
 
@@ -0,0 +1,60 @@
+"""
+Regex Engine Selection for Chartered
+
+Compiles patterns with Google's RE2 when it is installed, for linear-time
+matching on model output, and falls back to the standard library otherwise.
+
+Author: Chartered
+Version: 1.0.0
+"""
+
+import logging
+import re
+
+# Optional linear-time regex engine (pip install google-re2)
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+logger = logging.getLogger(__name__)
+
+# Constructs RE2 cannot compile: lookarounds, backreferences and \Z
+_RE2_UNSUPPORTED = re.compile(r'\(\?<?[=!]|\\[1-9Z]')
+# Constructs RE2 compiles but matches differently: its \s, \d, \w and \b are
+# ASCII-only (missing e.g. NBSP or Arabic-Indic digits), and its $ without
+# re.MULTILINE does not match before a trailing newline
+_RE2_DIVERGENT = re.compile(r'\\[sSdDwWbB]')
+_UNESCAPED_DOLLAR = re.compile(r'(?<!\\)(?:\\\\)*\$')
+_INLINE_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'))
+
+
+def _re2_equivalent(pattern: str, flags: int) -> bool:
+    """Whether RE2 compiles the pattern and matches it exactly as re does"""
+    if _RE2_UNSUPPORTED.search(pattern) or _RE2_DIVERGENT.search(pattern):
+        return False
+    return bool(flags & re.MULTILINE) or not _UNESCAPED_DOLLAR.search(pattern)
+
+
+def compile_pattern(pattern: str, flags: int = 0):
+    """
+    Compile a pattern, preferring RE2 when it is installed.
+    
+    Patterns using constructs RE2 does not support, or supports with
+    different semantics, fall back to the standard library engine, so a
+    pattern matches the same text whether or not RE2 is installed.
+    
+    Args:
+        pattern: Regular expression source
+        flags: re.IGNORECASE / re.MULTILINE / re.DOTALL combination
+        
+    Returns:
+        Compiled pattern exposing the re.Pattern search/sub/finditer API
+    """
+    if re2 is not None and _re2_equivalent(pattern, flags):
+        inline = ''.join(letter for flag, letter in _INLINE_FLAGS if flags & flag)
+        try:
+            return re2.compile(f'(?{inline}){pattern}' if inline else pattern)
+        except re2.error as e:
+            logger.debug(f"RE2 rejected pattern {pattern!r} ({e}); using re")
+    return re.compile(pattern, flags)
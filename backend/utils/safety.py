@@ -10,6 +10,7 @@ Version: 1.0.0
 
 import re
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
@@ -77,6 +78,20 @@ FOOTER_DISCLAIMER = """
 """
 
 
+# Disclaimer wrappers with their separators, joined once at import
+_TOP_PREFIX = f"{SHORT_DISCLAIMER}\n\n"
+_FOOTER_SUFFIX = f"\n\n{FOOTER_DISCLAIMER}"
+_MANDATORY_SUFFIX = f"\n\n{MANDATORY_DISCLAIMER}"
+
+# Phrases that mean the text already carries a disclaimer (matched lowercased)
+_DISCLAIMER_INDICATORS = (
+    'disclaimer',
+    'not financial advice',
+    'educational purposes only',
+    'not investment advice',
+)
+
+
 # ============================================================================
 # PROHIBITED PATTERNS
 # ============================================================================
@@ -122,6 +137,66 @@ REQUIRED_PROBABILISTIC_TERMS = [
     'may', 'might', 'could', 'suggests', 'indicates', 'appears',
     'typically', 'often', 'sometimes', 'potentially', 'possible'
 ]
+_PROBABILISTIC_TERM_SET = frozenset(REQUIRED_PROBABILISTIC_TERMS)
+# Whole words only, so 'may' is not counted inside 'maybe'; apostrophes split
+# words, so "could've" and quoted 'may' still count
+_WORD_RE = re.compile(r"[a-z]+")
+
+
+# Guardrail patterns always use re: RE2's \s, \d and \b are ASCII-only, so
+# e.g. 'buy\xa0now' would slip through whenever google-re2 is installed
+def _fuse_patterns(patterns: List[str]):
+    """
+    Compile a pattern list into one case-insensitive alternation.
+    
+    Alternative i is wrapped in group p<i>, so match.lastgroup identifies
+    which pattern matched.
+    """
+    return re.compile('|'.join(f'(?P<p{i}>{p})' for i, p in enumerate(patterns)), re.IGNORECASE)
+
+
+# One alternation per category, scanned in a single pass
+_FINANCIAL_ADVICE_RE = _fuse_patterns(FINANCIAL_ADVICE_PATTERNS)
+_TRADE_INSTRUCTION_RE = _fuse_patterns(TRADE_INSTRUCTION_PATTERNS)
+_PRICE_PREDICTION_RE = _fuse_patterns(PRICE_PREDICTION_PATTERNS)
+_GUARANTEED_OUTCOME_RE = _fuse_patterns(GUARANTEED_OUTCOME_PATTERNS)
+
+# Violations that block output in strict mode (low confidence only warns)
+_BLOCKING_VIOLATIONS = (
+    ViolationType.FINANCIAL_ADVICE,
+    ViolationType.TRADE_INSTRUCTION,
+    ViolationType.GUARANTEED_OUTCOME,
+)
+
+# Every category at once; a miss rules out all four per-category scans
+_ANY_VIOLATION_RE = re.compile(
+    '|'.join(f'(?:{p})' for p in (
+        FINANCIAL_ADVICE_PATTERNS + TRADE_INSTRUCTION_PATTERNS
+        + PRICE_PREDICTION_PATTERNS + GUARANTEED_OUTCOME_PATTERNS
+    )),
+    re.IGNORECASE,
+)
+
+def _ascii_ci(word: str) -> str:
+    """
+    Spell a plain ASCII keyword as case-insensitive character classes.
+    
+    Avoids re.IGNORECASE, whose Unicode folding also matches e.g. 'ſhould'
+    (long s) - a match that .lower() cannot map back to a keyword.
+    """
+    return ''.join(f'[{c.lower()}{c.upper()}]' if c.isalpha() else re.escape(c) for c in word)
+
+
+# Definitive words softened by sanitize_output, and their replacements
+_SANITIZE_REPLACEMENTS = {
+    'will': 'may',
+    'should': 'could',
+    'definitely': 'potentially',
+    'guaranteed': 'possible',
+}
+_SANITIZE_RE = re.compile(
+    r'\b(' + '|'.join(_ascii_ci(word) for word in _SANITIZE_REPLACEMENTS) + r')\b'
+)
 
 
 # ============================================================================
@@ -172,48 +247,49 @@ class SafetyValidator:
         warnings = []
         modified_output = output
         
-        # Check for financial advice
-        if self._contains_financial_advice(output):
-            violations.append(ViolationType.FINANCIAL_ADVICE)
-            warnings.append("Output contains language that may be interpreted as financial advice")
-        
-        # Check for trade instructions
-        if self._contains_trade_instructions(output):
-            violations.append(ViolationType.TRADE_INSTRUCTION)
-            warnings.append("Output contains specific trade instructions")
-        
-        # Check for price predictions
-        if self._contains_price_predictions(output):
-            violations.append(ViolationType.PRICE_PREDICTION)
-            warnings.append("Output contains price predictions")
+        # Clean text is cleared by one combined scan; otherwise find
+        # which categories matched
+        if _ANY_VIOLATION_RE.search(output):
+            # Check for financial advice
+            if self._contains_financial_advice(output):
+                violations.append(ViolationType.FINANCIAL_ADVICE)
+                warnings.append("Output contains language that may be interpreted as financial advice")
+            
+            # Check for trade instructions
+            if self._contains_trade_instructions(output):
+                violations.append(ViolationType.TRADE_INSTRUCTION)
+                warnings.append("Output contains specific trade instructions")
+            
+            # Check for price predictions
+            if self._contains_price_predictions(output):
+                violations.append(ViolationType.PRICE_PREDICTION)
+                warnings.append("Output contains price predictions")
+            
+            # Check for guaranteed outcomes
+            if self._contains_guaranteed_outcomes(output):
+                violations.append(ViolationType.GUARANTEED_OUTCOME)
+                warnings.append("Output contains language suggesting guaranteed outcomes")
         
-        # Check for guaranteed outcomes
-        if self._contains_guaranteed_outcomes(output):
-            violations.append(ViolationType.GUARANTEED_OUTCOME)
-            warnings.append("Output contains language suggesting guaranteed outcomes")
+        # In strict mode, only block on critical violations, not low confidence
+        blocked = self.strict_mode and any(v in violations for v in _BLOCKING_VIOLATIONS)
         
         # Check confidence level
-        confidence_score = self._assess_confidence(output, confidence)
+        output_lower = output.lower()
+        confidence_score = self._assess_confidence(output, confidence, output_lower)
         if confidence_score < 0.3:
             violations.append(ViolationType.LOW_CONFIDENCE)
             warnings.append("Analysis confidence is too low for safe display")
         
-        # Check for disclaimer
-        if include_disclaimer and not self._has_disclaimer(output):
+        # Check for disclaimer (blocked output is never shown, so it is
+        # reported but not rewritten)
+        if include_disclaimer and not self._has_disclaimer(output, output_lower):
             violations.append(ViolationType.MISSING_DISCLAIMER)
-            modified_output = self._inject_disclaimer(output)
+            if not blocked:
+                modified_output = self._inject_disclaimer(output)
         
         # Determine safety level
-        if violations and self.strict_mode:
-            # In strict mode, only block on critical violations, not low confidence
-            if any(v in violations for v in [
-                ViolationType.FINANCIAL_ADVICE,
-                ViolationType.TRADE_INSTRUCTION,
-                ViolationType.GUARANTEED_OUTCOME
-            ]):
-                level = SafetyLevel.BLOCKED
-            else:
-                level = SafetyLevel.WARNING
+        if blocked:
+            level = SafetyLevel.BLOCKED
         elif violations:
             level = SafetyLevel.WARNING
         else:
@@ -227,42 +303,47 @@ class SafetyValidator:
             confidence_score=confidence_score
         )
     
+    def _matches_category(
+        self,
+        text: str,
+        category_re,
+        patterns: List[str],
+        label: str
+    ) -> bool:
+        """Search text with a fused category pattern, logging which pattern hit"""
+        match = category_re.search(text)
+        if match is None:
+            return False
+        self.logger.warning(f"{label} pattern detected: {patterns[int(match.lastgroup[1:])]}")
+        return True
+    
     def _contains_financial_advice(self, text: str) -> bool:
         """Check if text contains financial advice language"""
-        for pattern in FINANCIAL_ADVICE_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                self.logger.warning(f"Financial advice pattern detected: {pattern}")
-                return True
-        return False
+        return self._matches_category(text, _FINANCIAL_ADVICE_RE, FINANCIAL_ADVICE_PATTERNS, "Financial advice")
     
     def _contains_trade_instructions(self, text: str) -> bool:
         """Check if text contains specific trade instructions"""
-        for pattern in TRADE_INSTRUCTION_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                self.logger.warning(f"Trade instruction pattern detected: {pattern}")
-                return True
-        return False
+        return self._matches_category(text, _TRADE_INSTRUCTION_RE, TRADE_INSTRUCTION_PATTERNS, "Trade instruction")
     
     def _contains_price_predictions(self, text: str) -> bool:
         """Check if text contains price predictions"""
-        for pattern in PRICE_PREDICTION_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                self.logger.warning(f"Price prediction pattern detected: {pattern}")
-                return True
-        return False
+        return self._matches_category(text, _PRICE_PREDICTION_RE, PRICE_PREDICTION_PATTERNS, "Price prediction")
     
     def _contains_guaranteed_outcomes(self, text: str) -> bool:
         """Check if text contains guaranteed outcome language"""
-        for pattern in GUARANTEED_OUTCOME_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                self.logger.warning(f"Guaranteed outcome pattern detected: {pattern}")
-                return True
-        return False
+        return self._matches_category(text, _GUARANTEED_OUTCOME_RE, GUARANTEED_OUTCOME_PATTERNS, "Guaranteed outcome")
     
-    def _assess_confidence(self, text: str, confidence: Optional[str]) -> float:
+    def _assess_confidence(
+        self,
+        text: str,
+        confidence: Optional[str],
+        text_lower: Optional[str] = None
+    ) -> float:
         """
         Assess confidence level of analysis.
         
+        text_lower may be passed when the caller already lowercased text.
+        
         Returns score from 0.0 to 1.0
         """
         # Start with base score from explicit confidence level
@@ -280,9 +361,10 @@ class SafetyValidator:
             base_score = 0.5
         
         # Check for probabilistic language (increases confidence in safety)
-        probabilistic_count = sum(
-            1 for term in REQUIRED_PROBABILISTIC_TERMS
-            if term in text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
+        probabilistic_count = len(
+            _PROBABILISTIC_TERM_SET.intersection(_WORD_RE.findall(text_lower))
         )
         
         # Adjust score based on probabilistic language
@@ -293,16 +375,11 @@ class SafetyValidator:
         
         return base_score
     
-    def _has_disclaimer(self, text: str) -> bool:
-        """Check if text already contains a disclaimer"""
-        disclaimer_indicators = [
-            'disclaimer',
-            'not financial advice',
-            'educational purposes only',
-            'not investment advice'
-        ]
-        text_lower = text.lower()
-        return any(indicator in text_lower for indicator in disclaimer_indicators)
+    def _has_disclaimer(self, text: str, text_lower: Optional[str] = None) -> bool:
+        """Check if text already contains a disclaimer (text_lower: precomputed text.lower())"""
+        if text_lower is None:
+            text_lower = text.lower()
+        return any(indicator in text_lower for indicator in _DISCLAIMER_INDICATORS)
     
     def _inject_disclaimer(self, text: str, position: str = 'top') -> str:
         """
@@ -316,11 +393,11 @@ class SafetyValidator:
             Text with disclaimer injected
         """
         if position == 'top':
-            return f"{SHORT_DISCLAIMER}\n\n{text}\n\n{FOOTER_DISCLAIMER}"
+            return f"{_TOP_PREFIX}{text}{_FOOTER_SUFFIX}"
         elif position == 'bottom':
-            return f"{text}\n\n{MANDATORY_DISCLAIMER}"
+            return text + _MANDATORY_SUFFIX
         else:  # both
-            return f"{SHORT_DISCLAIMER}\n\n{text}\n\n{MANDATORY_DISCLAIMER}"
+            return f"{_TOP_PREFIX}{text}{_MANDATORY_SUFFIX}"
     
     def sanitize_output(self, text: str) -> str:
         """
@@ -332,19 +409,12 @@ class SafetyValidator:
         Returns:
             Sanitized text
         """
-        sanitized = text
-        
-        # Replace "will" with "may"
-        sanitized = re.sub(r'\bwill\b', 'may', sanitized, flags=re.IGNORECASE)
-        
-        # Replace "should" with "could"
-        sanitized = re.sub(r'\bshould\b', 'could', sanitized, flags=re.IGNORECASE)
-        
-        # Replace "definitely" with "potentially"
-        sanitized = re.sub(r'\bdefinitely\b', 'potentially', sanitized, flags=re.IGNORECASE)
-        
-        # Replace "guaranteed" with "possible"
-        sanitized = re.sub(r'\bguaranteed\b', 'possible', sanitized, flags=re.IGNORECASE)
+        # will -> may, should -> could, definitely -> potentially,
+        # guaranteed -> possible, in one pass
+        sanitized = _SANITIZE_RE.sub(
+            lambda match: _SANITIZE_REPLACEMENTS[match.group(1).lower()],
+            text
+        )
         
         self.logger.info("Output sanitized for safety compliance")
         return sanitized
@@ -354,6 +424,35 @@ class SafetyValidator:
 # SAFE FAILURE HANDLER
 # ============================================================================
 
+# Display label per violation type, e.g. "financial_advice" -> "Financial Advice"
+_VIOLATION_LABELS = {v: v.value.replace('_', ' ').title() for v in ViolationType}
+
+
+@lru_cache(maxsize=64)
+def _blocked_message(violations: Tuple[ViolationType, ...]) -> str:
+    """Build the blocked message once per ordered violation tuple"""
+    issues = "\n".join(f'- {_VIOLATION_LABELS[v]}' for v in violations)
+    
+    return f"""
+## Analysis Blocked
+
+The AI-generated analysis was blocked due to safety concerns.
+
+**Detected Issues:**
+{issues}
+
+**Why This Happens:**
+Our safety system detected language that could be misinterpreted as financial advice, trade instructions, or guaranteed predictions. We block such outputs to ensure responsible AI usage.
+
+**What This Means:**
+- The AI model generated content that doesn't meet our safety standards
+- This is a protective measure, not an error
+- You can try analyzing a different chart
+
+**Remember:** Chartered is an educational tool for learning technical analysis concepts, not a trading system or financial advisor.
+"""
+
+
 class SafeFailureHandler:
     """
     Handles safe failure scenarios when AI confidence is low or errors occur.
@@ -402,32 +501,19 @@ We encountered an error while analyzing this chart. Please try again.
     @staticmethod
     def get_blocked_message(violations: List[ViolationType]) -> str:
         """Return message when output is blocked due to violations"""
-        violation_names = [v.value.replace('_', ' ').title() for v in violations]
-        
-        return f"""
-## Analysis Blocked
-
-The AI-generated analysis was blocked due to safety concerns.
-
-**Detected Issues:**
-{chr(10).join(f'- {v}' for v in violation_names)}
-
-**Why This Happens:**
-Our safety system detected language that could be misinterpreted as financial advice, trade instructions, or guaranteed predictions. We block such outputs to ensure responsible AI usage.
-
-**What This Means:**
-- The AI model generated content that doesn't meet our safety standards
-- This is a protective measure, not an error
-- You can try analyzing a different chart
-
-**Remember:** Chartered is an educational tool for learning technical analysis concepts, not a trading system or financial advisor.
-"""
+        return _blocked_message(tuple(violations))
 
 
 # ============================================================================
 # CONVENIENCE FUNCTIONS
 # ============================================================================
 
+@lru_cache(maxsize=2)
+def _get_validator(strict_mode: bool) -> SafetyValidator:
+    """Return the shared validator for a strictness mode (validators are stateless)"""
+    return SafetyValidator(strict_mode=strict_mode)
+
+
 def validate_and_sanitize(
     output: str,
     confidence: Optional[str] = None,
@@ -444,7 +530,7 @@ def validate_and_sanitize(
     Returns:
         Tuple of (is_safe, sanitized_output, warnings)
     """
-    validator = SafetyValidator(strict_mode=strict_mode)
+    validator = _get_validator(strict_mode)
     result = validator.validate_output(output, confidence)
     
     if result.level == SafetyLevel.BLOCKED:
@@ -469,8 +555,7 @@ def inject_disclaimer(text: str, position: str = 'both') -> str:
     Returns:
         Text with disclaimer
     """
-    validator = SafetyValidator()
-    return validator._inject_disclaimer(text, position)
+    return _get_validator(True)._inject_disclaimer(text, position)
 
 
 # ============================================================================
@@ -9,14 +9,12 @@ import sys
 import os
 from pathlib import Path
 import base64
-from io import BytesIO
-from PIL import Image
+import binascii
 import logging
 
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from backend.services.orchestrator import ChartAnalysisOrchestrator
 from backend.config import VISION_MODEL_ID, REASONING_MODEL_ID, HF_API_KEY
 
 # Configure logging
@@ -32,11 +30,24 @@ logger.info(f"Reasoning model: {REASONING_MODEL_ID}")
 # Initialize orchestrator (reuse across invocations for better performance)
 orchestrator = None
 
+# CORS and content headers; responses get their own copy so a mutation
+# by the runtime or a later handler cannot leak into other invocations
+_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type',
+    'Access-Control-Allow-Methods': 'POST, OPTIONS',
+    'Content-Type': 'application/json'
+}
+# Preflight status and body; handlers add their own headers copy
+_PREFLIGHT_RESPONSE = {'statusCode': 200, 'body': ''}
+
 
 def get_orchestrator():
     """Get or create orchestrator instance"""
     global orchestrator
     if orchestrator is None:
+        # Imported on first use so early-exit requests skip the pipeline imports
+        from backend.services.orchestrator import ChartAnalysisOrchestrator
         orchestrator = ChartAnalysisOrchestrator(strict_safety=False)
     return orchestrator
 
@@ -52,26 +63,14 @@ def handler(event, context):
     Returns:
         Response object with analysis results
     """
-    # Set CORS headers
-    headers = {
-        'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Headers': 'Content-Type',
-        'Access-Control-Allow-Methods': 'POST, OPTIONS',
-        'Content-Type': 'application/json'
-    }
-    
     # Handle preflight requests
     if event.get('httpMethod') == 'OPTIONS':
-        return {
-            'statusCode': 200,
-            'headers': headers,
-            'body': ''
-        }
+        return {**_PREFLIGHT_RESPONSE, 'headers': dict(_HEADERS)}
     
     if not HF_API_KEY:
         return {
             'statusCode': 503,
-            'headers': headers,
+            'headers': dict(_HEADERS),
             'body': json.dumps({
                 'error': 'Service unavailable',
                 'message': 'HF_API_KEY is not set. Add it in Netlify Site settings → Environment variables.'
@@ -83,7 +82,7 @@ def handler(event, context):
         if event.get('httpMethod') != 'POST':
             return {
                 'statusCode': 405,
-                'headers': headers,
+                'headers': dict(_HEADERS),
                 'body': json.dumps({
                     'error': 'Method not allowed',
                     'message': 'Only POST requests are supported'
@@ -104,7 +103,7 @@ def handler(event, context):
             logger.error("Multipart form data not fully supported yet")
             return {
                 'statusCode': 400,
-                'headers': headers,
+                'headers': dict(_HEADERS),
                 'body': json.dumps({
                     'error': 'Invalid request format',
                     'message': 'Please send image as base64 JSON'
@@ -122,30 +121,34 @@ def handler(event, context):
             if not image_data:
                 return {
                     'statusCode': 400,
-                    'headers': headers,
+                    'headers': dict(_HEADERS),
                     'body': json.dumps({
                         'error': 'Missing image data',
                         'message': 'Please provide image in base64 format'
                     })
                 }
             
-            # Decode base64 image
+            # Decode base64 image, dropping any data-URL header
             if image_data.startswith('data:image'):
-                image_data = image_data.split(',')[1]
+                image_data = image_data.partition(',')[2]
             
-            image_bytes = base64.b64decode(image_data)
+            image_bytes = binascii.a2b_base64(image_data)
         
         # Validate image
+        from io import BytesIO
+        from PIL import Image
+        
         try:
+            # Size comes from the header parse, so it is read before verify()
+            # invalidates the image
             image = Image.open(BytesIO(image_bytes))
+            width, height = image.size
             image.verify()
             
-            # Reopen after verify
-            image = Image.open(BytesIO(image_bytes))
-            if image.size[0] < 100 or image.size[1] < 100:
+            if width < 100 or height < 100:
                 return {
                     'statusCode': 400,
-                    'headers': headers,
+                    'headers': dict(_HEADERS),
                     'body': json.dumps({
                         'error': 'Image too small',
                         'message': 'Image must be at least 100x100 pixels'
@@ -155,7 +158,7 @@ def handler(event, context):
             logger.error(f"Image validation failed: {e}")
             return {
                 'statusCode': 400,
-                'headers': headers,
+                'headers': dict(_HEADERS),
                 'body': json.dumps({
                     'error': 'Invalid image',
                     'message': f'Failed to process image: {str(e)}'
@@ -171,7 +174,7 @@ def handler(event, context):
             logger.error(f"Analysis failed: {result.error_message}")
             return {
                 'statusCode': 500,
-                'headers': headers,
+                'headers': dict(_HEADERS),
                 'body': json.dumps({
                     'error': 'Analysis failed',
                     'message': result.error_message or 'Unknown error occurred'
@@ -182,55 +185,66 @@ def handler(event, context):
         analysis = result.analysis
         from datetime import datetime
         
+        vision = analysis.get("vision", {})
+        chart_info = vision.get("chart_info", {})
+        reasoning = analysis.get("analysis", {})
+        market_structure = reasoning.get("market_structure", {})
+        momentum = reasoning.get("momentum", {})
+        regime = reasoning.get("regime", {})
+        strategy_bias = reasoning.get("strategy_bias", {})
+        approaches = reasoning.get("approaches", {})
+        invalidation = reasoning.get("invalidation", {})
+        trading_signals = reasoning.get("trading_signals", {})
+        
         response_data = {
             "vision": {
-                "chart_type": analysis.get("vision", {}).get("chart_info", {}).get("type", "Unknown"),
-                "timeframe": analysis.get("vision", {}).get("chart_info", {}).get("timeframe", "N/A"),
-                "price_structure": analysis.get("vision", {}).get("price_structure", "N/A"),
-                "indicators_detected": analysis.get("vision", {}).get("indicators", []),
-                "visual_patterns": analysis.get("vision", {}).get("patterns", []),
-                "momentum_signals": analysis.get("vision", {}).get("momentum", "N/A")
+                "chart_type": chart_info.get("type", "Unknown"),
+                "timeframe": chart_info.get("timeframe", "N/A"),
+                "price_structure": vision.get("price_structure", "N/A"),
+                "indicators_detected": vision.get("indicators", []),
+                "visual_patterns": vision.get("patterns", []),
+                "momentum_signals": vision.get("momentum", "N/A")
             },
             "reasoning": {
                 "market_structure": {
-                    "trend_description": analysis.get("analysis", {}).get("market_structure", {}).get("trend", "N/A"),
-                    "key_levels": analysis.get("analysis", {}).get("market_structure", {}).get("key_levels", ["Not specified"]),
-                    "structural_notes": analysis.get("analysis", {}).get("market_structure", {}).get("notes", [])
+                    "trend_description": market_structure.get("trend", "N/A"),
+                    "key_levels": market_structure.get("key_levels", ["Not specified"]),
+                    "structural_notes": market_structure.get("notes", [])
                 },
                 "momentum": {
-                    "assessment": analysis.get("analysis", {}).get("momentum", {}).get("assessment", "N/A"),
-                    "indicators": analysis.get("analysis", {}).get("momentum", {}).get("indicators", ["Not specified"]),
-                    "divergences": analysis.get("analysis", {}).get("momentum", {}).get("divergences", []),
-                    "strength": analysis.get("analysis", {}).get("momentum", {}).get("strength", "Mixed")
+                    "assessment": momentum.get("assessment", "N/A"),
+                    "indicators": momentum.get("indicators", ["Not specified"]),
+                    "divergences": momentum.get("divergences", []),
+                    "strength": momentum.get("strength", "Mixed")
                 },
                 "regime": {
-                    "regime": analysis.get("analysis", {}).get("regime", {}).get("classification", "Indecisive"),
-                    "reasoning": analysis.get("analysis", {}).get("regime", {}).get("reasoning", "N/A"),
-                    "volatility": analysis.get("analysis", {}).get("regime", {}).get("volatility", "Moderate")
+                    "regime": regime.get("classification", "Indecisive"),
+                    "reasoning": regime.get("reasoning", "N/A"),
+                    "volatility": regime.get("volatility", "Moderate")
                 },
                 "strategy_bias": {
-                    "bias": analysis.get("analysis", {}).get("strategy_bias", {}).get("bias", "Neutral"),
-                    "confidence": analysis.get("analysis", {}).get("strategy_bias", {}).get("confidence", "Medium"),
-                    "reasoning": analysis.get("analysis", {}).get("strategy_bias", {}).get("reasoning", ["Not specified"])
+                    "bias": strategy_bias.get("bias", "Neutral"),
+                    "confidence": strategy_bias.get("confidence", "Medium"),
+                    "reasoning": strategy_bias.get("reasoning", ["Not specified"])
                 },
                 "suitable_approaches": {
-                    "approaches": analysis.get("analysis", {}).get("approaches", {}).get("options", [])
+                    "approaches": approaches.get("options", [])
                 },
                 "invalidation": {
-                    "bullish_invalidation": analysis.get("analysis", {}).get("invalidation", {}).get("bullish", ["Not specified"]),
-                    "bearish_invalidation": analysis.get("analysis", {}).get("invalidation", {}).get("bearish", ["Not specified"]),
-                    "key_levels": analysis.get("analysis", {}).get("invalidation", {}).get("key_levels", ["Not specified"])
+                    "bullish_invalidation": invalidation.get("bullish", ["Not specified"]),
+                    "bearish_invalidation": invalidation.get("bearish", ["Not specified"]),
+                    "key_levels": invalidation.get("key_levels", ["Not specified"])
                 },
                 "trading_signals": {
-                    "signal_type": analysis.get("analysis", {}).get("trading_signals", {}).get("signal_type", "WAIT"),
-                    "entry_level": analysis.get("analysis", {}).get("trading_signals", {}).get("entry_level", "Not specified"),
-                    "stop_loss": analysis.get("analysis", {}).get("trading_signals", {}).get("stop_loss", "Not specified"),
-                    "take_profit_1": analysis.get("analysis", {}).get("trading_signals", {}).get("take_profit_1", "Not specified"),
-                    "take_profit_2": analysis.get("analysis", {}).get("trading_signals", {}).get("take_profit_2"),
-                    "risk_reward_ratio": analysis.get("analysis", {}).get("trading_signals", {}).get("risk_reward_ratio", "Not specified"),
-                    "position_sizing": analysis.get("analysis", {}).get("trading_signals", {}).get("position_sizing", "Risk 1-2% of capital"),
-                    "timeframe_context": analysis.get("analysis", {}).get("trading_signals", {}).get("timeframe_context"),
-                    "confidence_score": analysis.get("analysis", {}).get("trading_signals", {}).get("confidence_score", "Medium")
+                    "signal_type": trading_signals.get("signal_type", "WAIT"),
+                    "entry_level": trading_signals.get("entry_level", "Not specified"),
+                    "stop_loss": trading_signals.get("stop_loss", "Not specified"),
+                    "take_profit_1": trading_signals.get("take_profit_1", "Not specified"),
+                    "take_profit_2": trading_signals.get("take_profit_2"),
+                    "risk_reward_ratio": trading_signals.get("risk_reward_ratio", "Not specified"),
+                    "position_sizing": trading_signals.get("position_sizing", "Risk 1-2% of capital"),
+                    "timeframe_context": trading_signals.get("timeframe_context"),
+                    "confidence_score": trading_signals.get("confidence_score", "Medium")
                 }
             },
             "metadata": {
@@ -244,7 +258,7 @@ def handler(event, context):
         logger.info("Analysis completed successfully")
         return {
             'statusCode': 200,
-            'headers': headers,
+            'headers': dict(_HEADERS),
             'body': json.dumps(response_data)
         }
         
@@ -252,7 +266,7 @@ def handler(event, context):
         logger.error(f"JSON decode error: {e}")
         return {
             'statusCode': 400,
-            'headers': headers,
+            'headers': dict(_HEADERS),
             'body': json.dumps({
                 'error': 'Invalid JSON',
                 'message': str(e)
@@ -262,7 +276,7 @@ def handler(event, context):
         logger.error(f"Unexpected error: {e}", exc_info=True)
         return {
             'statusCode': 500,
-            'headers': headers,
+            'headers': dict(_HEADERS),
             'body': json.dumps({
                 'error': 'Internal server error',
                 'message': str(e)
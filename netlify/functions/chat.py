@@ -5,9 +5,12 @@ Handles follow-up questions about chart analysis using the reasoning model.
 Session state is in-memory per function instance (may reset on cold start).
 """
 
+import base64
 import json
 import sys
 import os
+import hashlib
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
 import logging
@@ -16,14 +19,35 @@ import logging
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from backend.core.hf_client import HuggingFaceClient, HFConfig
-from backend.config import REASONING_MODEL_ID, HF_API_KEY
+from backend.config import REASONING_MODEL_ID, HF_API_KEY, ENABLE_CACHING, RESPONSE_CACHE_SIZE
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Sessions kept per instance (least recently used dropped first) and the
+# number of recent messages each keeps for the prompt
+_MAX_SESSIONS = 256
+_HISTORY_WINDOW = 10
+# Rough prompt budget for prior turns, estimated at ~4 characters per token
+_HISTORY_TOKEN_BUDGET = 1500
+_CHARS_PER_TOKEN = 4
+
 # Reuse client across invocations
 _chat_client = None
-_chat_sessions = {}
+_chat_sessions = OrderedDict()
+# Replies keyed by a digest of the exact prompt sent to the model (LRU order)
+_response_cache = OrderedDict()
+
+# CORS and content headers; responses get their own copy so a mutation
+# by the runtime or a later handler cannot leak into other invocations
+_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "Content-Type",
+    "Access-Control-Allow-Methods": "POST, DELETE, OPTIONS",
+    "Content-Type": "application/json",
+}
+# Preflight status and body; handlers add their own headers copy
+_PREFLIGHT_RESPONSE = {"statusCode": 200, "body": ""}
 
 
 def get_chat_client():
@@ -37,16 +61,72 @@ def get_chat_client():
     return _chat_client
 
 
-def handler(event, context):
-    headers = {
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Headers": "Content-Type",
-        "Access-Control-Allow-Methods": "POST, DELETE, OPTIONS",
-        "Content-Type": "application/json",
-    }
+# Chart preamble, filled from the analysis context by _build_system_prompt
+_CONTEXT_SUMMARY_TEMPLATE = """
+You are analyzing a trading chart with the following details:
+
+**Chart Information:**
+- Type: {chart_type}
+- Timeframe: {timeframe}
+- Price Structure: {price_structure}
+
+**Market Analysis:**
+- Trend: {trend}
+- Momentum: {momentum}
+- Market Regime: {regime}
+- Strategy Bias: {bias} (Confidence: {confidence})
+
+Please answer questions about this chart analysis in a helpful and insightful manner.
+"""
+
+
+def _dig(d, *path, default):
+    """Follow a key path through nested dicts, returning default where it breaks off"""
+    for key in path:
+        if not isinstance(d, dict) or key not in d:
+            return default
+        d = d[key]
+    return d
+
+
+def _build_system_prompt(a):
+    """Build the system preamble for an analysis context (None for no chart)"""
+    if not a:
+        return "You are an expert trading analyst. Help users understand chart analysis and trading strategies."
+    
+    context_summary = _CONTEXT_SUMMARY_TEMPLATE.format_map({
+        "chart_type": _dig(a, "vision", "chart_type", default="Unknown"),
+        "timeframe": _dig(a, "vision", "timeframe", default="Unknown"),
+        "price_structure": _dig(a, "vision", "price_structure", default="N/A"),
+        "trend": _dig(a, "reasoning", "market_structure", "trend_description", default="N/A"),
+        "momentum": _dig(a, "reasoning", "momentum", "assessment", default="N/A"),
+        "regime": _dig(a, "reasoning", "regime", "regime", default="N/A"),
+        "bias": _dig(a, "reasoning", "strategy_bias", "bias", default="Neutral"),
+        "confidence": _dig(a, "reasoning", "strategy_bias", "confidence", default="Medium"),
+    })
+    return context_summary + "\n\nYou are an expert trading analyst. Provide clear, actionable insights based on the chart analysis."
+
+
+def _history_within_budget(history):
+    """
+    Return the trailing messages whose estimated tokens fit the history budget.
+    
+    The most recent message is always kept so short follow-ups keep their referent.
+    """
+    budget = _HISTORY_TOKEN_BUDGET * _CHARS_PER_TOKEN
+    start = len(history)
+    while start > 0:
+        size = len(history[start - 1]["content"])
+        if size > budget and start < len(history):
+            break
+        budget -= size
+        start -= 1
+    return history[start:]
 
+
+def handler(event, context):
     if event.get("httpMethod") == "OPTIONS":
-        return {"statusCode": 200, "headers": headers, "body": ""}
+        return {**_PREFLIGHT_RESPONSE, "headers": dict(_HEADERS)}
 
     path = event.get("path", "")
     if "DELETE" in event.get("httpMethod", ""):
@@ -57,46 +137,46 @@ def handler(event, context):
             del _chat_sessions[session_id]
         return {
             "statusCode": 200,
-            "headers": headers,
+            "headers": dict(_HEADERS),
             "body": json.dumps({"success": True, "message": "Session cleared"}),
         }
 
     if event.get("httpMethod") != "POST":
         return {
             "statusCode": 405,
-            "headers": headers,
+            "headers": dict(_HEADERS),
             "body": json.dumps({"error": "Method not allowed", "message": "Only POST is supported for chat"}),
         }
 
     try:
         body = event.get("body", "{}")
         if event.get("isBase64Encoded"):
-            import base64
             body = base64.b64decode(body).decode("utf-8")
         data = json.loads(body)
     except Exception as e:
         logger.error(f"JSON parse error: {e}")
         return {
             "statusCode": 400,
-            "headers": headers,
+            "headers": dict(_HEADERS),
             "body": json.dumps({"error": "Invalid JSON", "message": str(e)}),
         }
 
-    session_id = data.get("session_id") or f"session-{datetime.utcnow().timestamp()}"
+    now = datetime.utcnow()
+    session_id = data.get("session_id") or f"session-{now.timestamp()}"
     user_message = data.get("message", "").strip()
     analysis_context = data.get("analysis_context")
 
     if not user_message:
         return {
             "statusCode": 400,
-            "headers": headers,
+            "headers": dict(_HEADERS),
             "body": json.dumps({"error": "Missing message", "message": "Please provide a message"}),
         }
 
     if not HF_API_KEY:
         return {
             "statusCode": 503,
-            "headers": headers,
+            "headers": dict(_HEADERS),
             "body": json.dumps({
                 "error": "Chat unavailable",
                 "message": "HF_API_KEY is not configured. Set it in Netlify environment variables.",
@@ -107,69 +187,72 @@ def handler(event, context):
         _chat_sessions[session_id] = {
             "messages": [],
             "analysis_context": analysis_context,
-            "created_at": datetime.utcnow().isoformat(),
+            "created_at": now.isoformat(),
         }
+        while len(_chat_sessions) > _MAX_SESSIONS:
+            _chat_sessions.popitem(last=False)
+    else:
+        _chat_sessions.move_to_end(session_id)
     session = _chat_sessions[session_id]
     if analysis_context is not None:
         session["analysis_context"] = analysis_context
 
     session["messages"].append({"role": "user", "content": user_message})
+    # Only the last few messages reach the prompt, so older ones are dropped
+    del session["messages"][:-_HISTORY_WINDOW]
 
-    context_summary = ""
-    if session.get("analysis_context"):
-        a = session["analysis_context"]
-        context_summary = f"""
-You are analyzing a trading chart with the following details:
-
-**Chart Information:**
-- Type: {a.get('vision', {}).get('chart_type', 'Unknown')}
-- Timeframe: {a.get('vision', {}).get('timeframe', 'Unknown')}
-- Price Structure: {a.get('vision', {}).get('price_structure', 'N/A')}
+    # The preamble only changes with the analysis context, so it is built
+    # once per session and stays a byte-identical prefix across turns
+    if analysis_context is not None or "system_prompt" not in session:
+        session["system_prompt"] = _build_system_prompt(session.get("analysis_context"))
+    system = session["system_prompt"]
 
-**Market Analysis:**
-- Trend: {a.get('reasoning', {}).get('market_structure', {}).get('trend_description', 'N/A')}
-- Momentum: {a.get('reasoning', {}).get('momentum', {}).get('assessment', 'N/A')}
-- Market Regime: {a.get('reasoning', {}).get('regime', {}).get('regime', 'N/A')}
-- Strategy Bias: {a.get('reasoning', {}).get('strategy_bias', {}).get('bias', 'Neutral')} (Confidence: {a.get('reasoning', {}).get('strategy_bias', {}).get('confidence', 'Medium')})
-
-Please answer questions about this chart analysis in a helpful and insightful manner.
-"""
+    parts = [system, "\n\n"]
+    for msg in _history_within_budget(session["messages"][:-1]):
+        role_label = "User" if msg["role"] == "user" else "Assistant"
+        parts.append(f"{role_label}: {msg['content']}\n\n")
+    parts.append(f"User: {user_message}\n\nAssistant:")
+    full_prompt = "".join(parts)
 
-    system = (
-        context_summary + "\n\nYou are an expert trading analyst. Provide clear, actionable insights based on the chart analysis."
-        if context_summary
-        else "You are an expert trading analyst. Help users understand chart analysis and trading strategies."
-    )
+    # The key covers system text, history and the new message, so a hit is
+    # a prompt the model has already answered verbatim
+    cache_key = None
+    ai_response = None
+    if ENABLE_CACHING:
+        cache_key = hashlib.blake2b(full_prompt.encode("utf-8"), digest_size=16).hexdigest()
+        ai_response = _response_cache.get(cache_key)
 
-    recent = session["messages"][-10:]
-    full_prompt = system + "\n\n"
-    for msg in recent[:-1]:
-        role_label = "User" if msg["role"] == "user" else "Assistant"
-        full_prompt += f"{role_label}: {msg['content']}\n\n"
-    full_prompt += f"User: {user_message}\n\nAssistant:"
+    if ai_response is not None:
+        _response_cache.move_to_end(cache_key)
+        logger.info("Chat response served from cache")
+    else:
+        try:
+            client = get_chat_client()
+            ai_response = client.query_text_model(
+                prompt=full_prompt,
+                parameters={"max_new_tokens": 1000, "temperature": 0.7},
+            )
+        except Exception as e:
+            logger.error(f"Chat AI error: {e}", exc_info=True)
+            return {
+                "statusCode": 500,
+                "headers": dict(_HEADERS),
+                "body": json.dumps({
+                    "error": "Failed to generate response",
+                    "message": str(e),
+                }),
+            }
 
-    try:
-        client = get_chat_client()
-        ai_response = client.query_text_model(
-            prompt=full_prompt,
-            parameters={"max_new_tokens": 1000, "temperature": 0.7},
-        )
-    except Exception as e:
-        logger.error(f"Chat AI error: {e}", exc_info=True)
-        return {
-            "statusCode": 500,
-            "headers": headers,
-            "body": json.dumps({
-                "error": "Failed to generate response",
-                "message": str(e),
-            }),
-        }
+        if cache_key is not None:
+            _response_cache[cache_key] = ai_response
+            while len(_response_cache) > RESPONSE_CACHE_SIZE:
+                _response_cache.popitem(last=False)
 
     session["messages"].append({"role": "assistant", "content": ai_response})
 
     return {
         "statusCode": 200,
-        "headers": headers,
+        "headers": dict(_HEADERS),
         "body": json.dumps({
             "session_id": session_id,
             "response": ai_response,
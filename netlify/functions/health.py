@@ -5,6 +5,8 @@ Simple diagnostic endpoint to verify:
 1. Function is deployed correctly
 2. Backend modules can be imported
 3. Environment variables are set
+
+Import checks only run for ?deep=1, so routine pings stay cheap on cold starts.
 """
 
 import json
@@ -12,18 +14,38 @@ import sys
 import os
 from pathlib import Path
 
+# Response body per check depth; env and imports are fixed for an instance
+_cached_bodies = {}
+
+# CORS and content headers; responses get their own copy so a mutation
+# by the runtime or a later handler cannot leak into other invocations
+_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type',
+    'Access-Control-Allow-Methods': 'GET, OPTIONS',
+    'Content-Type': 'application/json'
+}
+# Preflight status and body; handlers add their own headers copy
+_PREFLIGHT_RESPONSE = {'statusCode': 200, 'body': ''}
+
 def handler(event, context):
     """Health check handler"""
-    headers = {
-        'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Headers': 'Content-Type',
-        'Access-Control-Allow-Methods': 'GET, OPTIONS',
-        'Content-Type': 'application/json'
-    }
-    
     if event.get('httpMethod') == 'OPTIONS':
-        return {'statusCode': 200, 'headers': headers, 'body': ''}
+        return {**_PREFLIGHT_RESPONSE, 'headers': dict(_HEADERS)}
     
+    deep = (event.get('queryStringParameters') or {}).get('deep') == '1'
+    if deep not in _cached_bodies:
+        _cached_bodies[deep] = json.dumps(_collect_diagnostics(deep), indent=2)
+    
+    return {
+        'statusCode': 200,
+        'headers': dict(_HEADERS),
+        'body': _cached_bodies[deep]
+    }
+
+
+def _collect_diagnostics(deep):
+    """Gather environment diagnostics, plus backend import checks when deep"""
     diagnostics = {
         'status': 'ok',
         'python_version': sys.version,
@@ -44,36 +66,39 @@ def handler(event, context):
             diagnostics['environment'][var] = None
     
     # Try importing backend modules
-    import_tests = {}
-    try:
-        sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-        from backend.config import HF_API_KEY, VISION_MODEL_ID, REASONING_MODEL_ID
-        import_tests['backend.config'] = 'success'
-        import_tests['HF_API_KEY_from_config'] = f"{HF_API_KEY[:5]}..." if HF_API_KEY and len(HF_API_KEY) > 5 else "NOT SET"
-        import_tests['VISION_MODEL'] = VISION_MODEL_ID
-        import_tests['REASONING_MODEL'] = REASONING_MODEL_ID
-    except Exception as e:
-        import_tests['backend.config'] = f'failed: {str(e)}'
-    
-    try:
-        from backend.services.orchestrator import ChartAnalysisOrchestrator
-        import_tests['backend.orchestrator'] = 'success'
-    except Exception as e:
-        import_tests['backend.orchestrator'] = f'failed: {str(e)}'
-    
-    try:
-        from backend.core.hf_client import HuggingFaceClient
-        import_tests['backend.hf_client'] = 'success'
-    except Exception as e:
-        import_tests['backend.hf_client'] = f'failed: {str(e)}'
-    
-    try:
-        from PIL import Image
-        import_tests['PIL'] = 'success'
-    except Exception as e:
-        import_tests['PIL'] = f'failed: {str(e)}'
-    
-    diagnostics['imports'] = import_tests
+    if deep:
+        import_tests = {}
+        try:
+            sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+            from backend.config import HF_API_KEY, VISION_MODEL_ID, REASONING_MODEL_ID
+            import_tests['backend.config'] = 'success'
+            import_tests['HF_API_KEY_from_config'] = f"{HF_API_KEY[:5]}..." if HF_API_KEY and len(HF_API_KEY) > 5 else "NOT SET"
+            import_tests['VISION_MODEL'] = VISION_MODEL_ID
+            import_tests['REASONING_MODEL'] = REASONING_MODEL_ID
+        except Exception as e:
+            import_tests['backend.config'] = f'failed: {str(e)}'
+        
+        try:
+            from backend.services.orchestrator import ChartAnalysisOrchestrator
+            import_tests['backend.orchestrator'] = 'success'
+        except Exception as e:
+            import_tests['backend.orchestrator'] = f'failed: {str(e)}'
+        
+        try:
+            from backend.core.hf_client import HuggingFaceClient
+            import_tests['backend.hf_client'] = 'success'
+        except Exception as e:
+            import_tests['backend.hf_client'] = f'failed: {str(e)}'
+        
+        try:
+            from PIL import Image
+            import_tests['PIL'] = 'success'
+        except Exception as e:
+            import_tests['PIL'] = f'failed: {str(e)}'
+        
+        diagnostics['imports'] = import_tests
+    else:
+        diagnostics['imports'] = 'skipped (add ?deep=1 to check backend imports)'
     
     # Check critical issues
     issues = []
@@ -86,8 +111,4 @@ def handler(event, context):
         diagnostics['issues'] = issues
         diagnostics['status'] = 'has_issues'
     
-    return {
-        'statusCode': 200,
-        'headers': headers,
-        'body': json.dumps(diagnostics, indent=2)
-    }
+    return diagnostics
@@ -1,16 +1,14 @@
 import pytest
-import sys
-import os
+from pathlib import Path
 
-print("Starting test run...", file=sys.__stdout__)
+ROOT = Path(__file__).resolve().parent
+
+print("Starting test run...")
 
 try:
-    with open("/Users/advaitdharmadhikari/Documents/Personal Projects/chartsense/test_results_internal.txt", "w") as f:
-        sys.stdout = f
-        sys.stderr = f
-        print("Running tests...")
-        ret = pytest.main(["/Users/advaitdharmadhikari/Documents/Personal Projects/chartsense/tests/"])
-        print(f"Done. Return code: {ret}")
+    # pytest writes the report file itself; its own capture stays in charge of output
+    ret = pytest.main([str(ROOT / "tests"), f"--junit-xml={ROOT / 'test_results_internal.xml'}"])
+    print(f"Done. Return code: {ret}")
 except Exception as e:
-    with open("/Users/advaitdharmadhikari/Documents/Personal Projects/chartsense/error_log.txt", "w") as f:
+    with open(ROOT / "error_log.txt", "w") as f:
         f.write(str(e))
@@ -8,9 +8,13 @@ Requires HF_API_KEY environment variable to be set.
 
 import sys
 import os
+import io
 import logging
+from functools import lru_cache
 from pathlib import Path
 
+from PIL import Image
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -31,6 +35,18 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _test_image_bytes(size, color):
+    """
+    Encode a solid-colour JPEG test image, once per size and colour.
+    
+    JPEG matches the data:image/jpeg URI the client sends images under.
+    """
+    buffer = io.BytesIO()
+    Image.new('RGB', size, color=color).save(buffer, format='JPEG', quality=50)
+    return buffer.getvalue()
+
+
 def demo_configuration():
     """Demonstrate different configuration patterns"""
     logger.info("\n" + "="*60)
@@ -103,14 +119,8 @@ def demo_vision_model():
     client = create_vision_client(HF_API_KEY)
     
     # Create a simple test image
-    from PIL import Image
-    import io
-    
     logger.info("\n📊 Creating sample chart image...")
-    img = Image.new('RGB', (800, 600), color='#1e1e1e')
-    buffer = io.BytesIO()
-    img.save(buffer, format='PNG')
-    image_bytes = buffer.getvalue()
+    image_bytes = _test_image_bytes((800, 600), '#1e1e1e')
     
     logger.info(f"  Image size: {len(image_bytes)} bytes")
     
@@ -181,14 +191,7 @@ def demo_error_handling():
     client = create_vision_client("invalid_key")
     
     try:
-        from PIL import Image
-        import io
-        
-        img = Image.new('RGB', (100, 100), color='white')
-        buffer = io.BytesIO()
-        img.save(buffer, format='PNG')
-        
-        client.query_vision_model(buffer.getvalue(), "Test")
+        client.query_vision_model(_test_image_bytes((100, 100), 'white'), "Test")
     except HFAPIError as e:
         logger.info(f"  ✅ Caught expected error: {type(e).__name__}")
         logger.info(f"     Message: {e}")
@@ -198,14 +201,7 @@ def demo_error_handling():
     client = create_vision_client(HF_API_KEY, "fake/model-does-not-exist")
     
     try:
-        from PIL import Image
-        import io
-        
-        img = Image.new('RGB', (100, 100), color='white')
-        buffer = io.BytesIO()
-        img.save(buffer, format='PNG')
-        
-        client.query_vision_model(buffer.getvalue(), "Test")
+        client.query_vision_model(_test_image_bytes((100, 100), 'white'), "Test")
     except HFAPIError as e:
         logger.info(f"  ✅ Caught expected error: {type(e).__name__}")
         logger.info(f"     Message: {e}")
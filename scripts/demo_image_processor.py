@@ -16,6 +16,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from backend.core.image_processor import ImageProcessor, preprocess_chart_image
 from PIL import Image
 import io
+from functools import lru_cache
 
 # Setup logging
 logging.basicConfig(
@@ -25,8 +26,9 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
 def create_sample_chart():
-    """Create a sample chart image for demonstration"""
+    """Create a sample chart image for demonstration (encoded once, then reused)"""
     logger.info("Creating sample chart image...")
     
     # Create a simple chart-like image (1920x1080)
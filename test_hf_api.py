@@ -5,6 +5,7 @@ import requests
 import os
 from dotenv import load_dotenv
 import base64
+from concurrent.futures import ThreadPoolExecutor
 
 load_dotenv()
 
@@ -39,23 +40,31 @@ headers = {
 print("Testing HuggingFace API endpoints...\n")
 print(f"API Key: {API_KEY[:10]}...{API_KEY[-5:]}\n")
 
-for test in test_cases:
-    print(f"Test: {test['name']}")
-    print(f"  URL: {test['url']}")
+def run_test(test):
+    """Issue one test request; returns the response or the exception raised"""
     try:
         if test["method"] == "GET":
-            response = requests.get(test["url"], headers=headers, timeout=10)
-        else:
-            response = requests.post(test["url"], headers=headers, json=test.get("data"), timeout=30)
-        
-        print(f"  Status: {response.status_code}")
-        if response.status_code >= 400:
-            print(f"  Error: {response.text[:300]}")
-        else:
-            print(f"  ✓ Success: {response.text[:200]}")
+            return requests.get(test["url"], headers=headers, timeout=10)
+        return requests.post(test["url"], headers=headers, json=test.get("data"), timeout=30)
     except Exception as e:
-        print(f"  ✗ Exception: {e}")
-    print()
+        return e
+
+# Requests are I/O-bound, so run them concurrently; map keeps report order
+with ThreadPoolExecutor(max_workers=len(test_cases)) as executor:
+    results = executor.map(run_test, test_cases)
+    
+    for test, response in zip(test_cases, results):
+        print(f"Test: {test['name']}")
+        print(f"  URL: {test['url']}")
+        if isinstance(response, Exception):
+            print(f"  ✗ Exception: {response}")
+        else:
+            print(f"  Status: {response.status_code}")
+            if response.status_code >= 400:
+                print(f"  Error: {response.text[:300]}")
+            else:
+                print(f"  ✓ Success: {response.text[:200]}")
+        print()
 
 print("\nChecking documentation...")
 print("Try: https://huggingface.co/docs/api-inference/index")
@@ -0,0 +1,151 @@
+"""
+Unit Tests for the Netlify Chat Function
+
+Tests history trimming, session eviction, and reply caching through the
+handler with a mocked model client.
+"""
+
+import importlib.util
+import json
+from collections import OrderedDict
+from pathlib import Path
+from unittest.mock import Mock
+import pytest
+
+CHAT_PATH = Path(__file__).resolve().parent.parent / "netlify" / "functions" / "chat.py"
+
+
+@pytest.fixture(scope="module")
+def chat_module():
+    """Load netlify/functions/chat.py (not a package) as a module"""
+    spec = importlib.util.spec_from_file_location("netlify_chat_function", CHAT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def chat(chat_module, monkeypatch):
+    """Chat module with fresh state, an API key, caching on, and a mocked client"""
+    monkeypatch.setattr(chat_module, "HF_API_KEY", "test_key")
+    monkeypatch.setattr(chat_module, "ENABLE_CACHING", True)
+    monkeypatch.setattr(chat_module, "_chat_sessions", OrderedDict())
+    monkeypatch.setattr(chat_module, "_response_cache", OrderedDict())
+    client = Mock()
+    client.query_text_model.side_effect = lambda prompt, parameters: f"reply {client.query_text_model.call_count}"
+    monkeypatch.setattr(chat_module, "_chat_client", client)
+    return chat_module
+
+
+def send(chat, message, session_id="s1"):
+    """POST one chat message and return the decoded response body"""
+    response = chat.handler({
+        "httpMethod": "POST",
+        "body": json.dumps({"session_id": session_id, "message": message}),
+    }, None)
+    assert response["statusCode"] == 200
+    return json.loads(response["body"])
+
+
+def last_prompt(chat):
+    """Prompt sent to the model on the most recent call"""
+    return chat._chat_client.query_text_model.call_args.kwargs["prompt"]
+
+
+class TestHistoryTrimming:
+    """Test the message window and the history token budget"""
+    
+    def test_session_keeps_history_window(self, chat):
+        """Test a session stores at most the window plus the latest reply"""
+        for turn in range(8):
+            send(chat, f"question {turn}")
+        
+        messages = chat._chat_sessions["s1"]["messages"]
+        
+        assert len(messages) == chat._HISTORY_WINDOW + 1
+        assert messages[-2]["content"] == "question 7"
+        assert "question 2" not in last_prompt(chat)
+        assert "question 3" in last_prompt(chat)
+    
+    def test_budget_keeps_trailing_messages(self, chat, monkeypatch):
+        """Test older messages beyond the token budget are left out"""
+        monkeypatch.setattr(chat, "_HISTORY_TOKEN_BUDGET", 10)  # 40 characters
+        history = [{"role": "user", "content": "a" * 30}, {"role": "assistant", "content": "b" * 30}]
+        
+        assert chat._history_within_budget(history) == history[1:]
+    
+    def test_budget_always_keeps_newest_message(self, chat, monkeypatch):
+        """Test the newest message is kept even when it alone exceeds the budget"""
+        monkeypatch.setattr(chat, "_HISTORY_TOKEN_BUDGET", 10)
+        history = [{"role": "user", "content": "a"}, {"role": "assistant", "content": "b" * 100}]
+        
+        assert chat._history_within_budget(history) == history[1:]
+    
+    def test_budget_applies_to_handler_prompt(self, chat, monkeypatch):
+        """Test the handler drops over-budget history from the prompt"""
+        monkeypatch.setattr(chat, "_HISTORY_TOKEN_BUDGET", 10)
+        send(chat, "x" * 60)
+        send(chat, "follow up")
+        
+        prompt = last_prompt(chat)
+        
+        assert "x" * 60 not in prompt
+        assert "Assistant: reply 1" in prompt
+        assert prompt.endswith("User: follow up\n\nAssistant:")
+
+
+class TestSessionEviction:
+    """Test the per-instance session LRU"""
+    
+    def test_least_recently_used_session_is_evicted(self, chat, monkeypatch):
+        """Test sessions beyond _MAX_SESSIONS drop the least recently used"""
+        monkeypatch.setattr(chat, "_MAX_SESSIONS", 2)
+        send(chat, "hello", session_id="s1")
+        send(chat, "hello", session_id="s2")
+        send(chat, "again", session_id="s1")  # s1 becomes most recent
+        send(chat, "hello", session_id="s3")
+        
+        assert list(chat._chat_sessions) == ["s1", "s3"]
+    
+    def test_delete_clears_session(self, chat):
+        """Test DELETE removes the session"""
+        send(chat, "hello", session_id="s1")
+        
+        chat.handler({"httpMethod": "DELETE", "path": "/api/chat/s1"}, None)
+        
+        assert "s1" not in chat._chat_sessions
+
+
+class TestReplyCache:
+    """Test caching of replies by exact prompt"""
+    
+    def test_identical_prompt_served_from_cache(self, chat):
+        """Test a repeated prompt in a new session reuses the stored reply"""
+        first = send(chat, "what is the trend?", session_id="s1")
+        second = send(chat, "what is the trend?", session_id="s2")
+        
+        assert second["response"] == first["response"]
+        assert chat._chat_client.query_text_model.call_count == 1
+    
+    def test_cache_evicts_least_recently_used(self, chat, monkeypatch):
+        """Test replies beyond RESPONSE_CACHE_SIZE are evicted"""
+        monkeypatch.setattr(chat, "RESPONSE_CACHE_SIZE", 1)
+        send(chat, "first", session_id="s1")
+        send(chat, "second", session_id="s2")
+        send(chat, "first", session_id="s3")
+        
+        assert len(chat._response_cache) == 1
+        assert chat._chat_client.query_text_model.call_count == 3
+    
+    def test_caching_disabled(self, chat, monkeypatch):
+        """Test ENABLE_CACHING=False queries the model every time"""
+        monkeypatch.setattr(chat, "ENABLE_CACHING", False)
+        send(chat, "what is the trend?", session_id="s1")
+        send(chat, "what is the trend?", session_id="s2")
+        
+        assert chat._chat_client.query_text_model.call_count == 2
+        assert not chat._response_cache
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
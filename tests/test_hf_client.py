@@ -19,6 +19,10 @@ from backend.core.hf_client import (
     create_text_client
 )
 
+# Encoded once at import so tests never pay for base64 work in their bodies
+_FAKE_IMAGE_B64 = base64.b64encode(b"fake_image").decode('ascii')
+_LARGE_IMAGE_B64 = base64.b64encode(bytes(range(256)) * 4096).decode('ascii')  # 1 MB image
+
 
 class TestHFConfig:
     """Test HFConfig dataclass"""
@@ -147,13 +151,26 @@ class TestHuggingFaceClient:
         mock_post.return_value = mock_response
         
         # Test with base64 string
-        image_b64 = base64.b64encode(b"fake_image").decode('utf-8')
-        result = client.query_vision_model(image_b64, "Test prompt")
+        result = client.query_vision_model(_FAKE_IMAGE_B64, "Test prompt")
         
         # Should extract text from response
         assert result == "success response"
         assert isinstance(result, str)
     
+    @patch('backend.core.hf_client.requests.Session.post')
+    def test_query_vision_model_passes_base64_through(self, mock_post, client):
+        """Test pre-encoded images are sent without being re-encoded"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"choices": [{"message": {"content": "Chart"}}]}
+        mock_post.return_value = mock_response
+        
+        result = client.query_vision_model(_LARGE_IMAGE_B64, "Test prompt")
+        
+        assert result == "Chart"
+        content = mock_post.call_args.kwargs["json"]["messages"][0]["content"]
+        assert content[1]["image_url"]["url"] == f"data:image/jpeg;base64,{_LARGE_IMAGE_B64}"
+    
     @patch('backend.core.hf_client.requests.Session.post')
     def test_query_text_model_success(self, mock_post, client):
         """Test successful text model query"""
@@ -5,7 +5,7 @@ Tests validation, cropping, normalization, and resizing functionality.
 """
 
 import pytest
-from PIL import Image
+from PIL import Image, ImageEnhance, ImageOps
 import io
 from backend.core.image_processor import ImageProcessor, validate_chart_image, preprocess_chart_image
 
@@ -18,7 +18,7 @@ class TestImageProcessor:
         """Create ImageProcessor instance for tests"""
         return ImageProcessor()
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_image_bytes(self):
         """Create a sample image for testing"""
         # Create a simple test image (800x600 RGB)
@@ -27,7 +27,7 @@ class TestImageProcessor:
         img.save(buffer, format='PNG')
         return buffer.getvalue()
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def small_image_bytes(self):
         """Create a too-small image for testing"""
         img = Image.new('RGB', (300, 200), color='white')
@@ -76,6 +76,30 @@ class TestImageProcessor:
         assert normalized.size == image.size
         assert normalized.mode == 'RGB'
     
+    @pytest.mark.parametrize("mode", ['RGB', 'RGBA', 'L'])
+    def test_normalize_lut_matches_image_enhance(self, processor, mode):
+        """Test the single lookup pass matches ImageEnhance contrast then brightness"""
+        gradient = Image.linear_gradient('L').resize((256, 192))
+        if mode == 'L':
+            image = gradient
+        else:
+            bands = [gradient, gradient.transpose(Image.Transpose.ROTATE_90).resize((256, 192)),
+                     Image.effect_noise((256, 192), 64)]
+            if mode == 'RGBA':
+                bands.append(gradient.transpose(Image.Transpose.FLIP_LEFT_RIGHT))
+            image = Image.merge(mode, bands)
+        
+        source = image.convert('RGB') if mode == 'RGBA' else image
+        enhanced = ImageEnhance.Brightness(ImageEnhance.Contrast(source).enhance(1.2)).enhance(1.1)
+        
+        # Compare before equalize too, since equalize hides most monotone changes
+        lut = processor._enhancement_lut(source, 1.2, 1.1)
+        normalized = processor.normalize_contrast_brightness(image.copy())
+        
+        assert source.point(lut).tobytes() == enhanced.tobytes()
+        assert normalized.mode == 'RGB'
+        assert normalized.tobytes() == ImageOps.equalize(enhanced.convert('RGB')).tobytes()
+    
     def test_resize_for_model(self, processor, sample_image_bytes):
         """Test resizing to model dimensions"""
         image = Image.open(io.BytesIO(sample_image_bytes))
@@ -119,6 +143,27 @@ class TestImageProcessor:
         assert 'ui_removal' not in metadata['steps_applied']
         assert 'normalization' not in metadata['steps_applied']
     
+    @pytest.mark.parametrize("size", [(4000, 3000), (3840, 2160), (3583, 2687)])
+    @pytest.mark.parametrize("remove_ui", [True, False])
+    def test_jpeg_draft_keeps_output_size(self, processor, monkeypatch, size, remove_ui):
+        """Test drafting a large JPEG changes the output size by at most one pixel"""
+        image = Image.linear_gradient('L').resize(size).convert('RGB')
+        buffer = io.BytesIO()
+        image.save(buffer, format='JPEG', quality=75)
+        jpeg_bytes = buffer.getvalue()
+        
+        _, drafted = processor.preprocess(jpeg_bytes, remove_ui=remove_ui)
+        drafted_display = Image.open(io.BytesIO(processor.preprocess_for_display(jpeg_bytes))).size
+        monkeypatch.setattr(ImageProcessor, "_draft_for_model", lambda self, image, cropped: None)
+        _, full = processor.preprocess(jpeg_bytes, remove_ui=remove_ui)
+        full_display = Image.open(io.BytesIO(processor.preprocess_for_display(jpeg_bytes))).size
+        
+        assert drafted['original_size'] == size
+        if remove_ui:
+            assert drafted['cropped_size'][0] < full['cropped_size'][0]  # JPEG was drafted
+        for got, expected in zip(drafted['final_size'] + drafted_display, full['final_size'] + full_display):
+            assert abs(got - expected) <= 1
+    
     def test_convenience_function(self, sample_image_bytes):
         """Test convenience function works"""
         is_valid, error = validate_chart_image(sample_image_bytes)
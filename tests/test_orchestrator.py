@@ -0,0 +1,104 @@
+"""
+Unit Tests for Chart Analysis Orchestrator
+
+Tests result and per-stage caching with mocked model clients.
+"""
+
+import io
+import pytest
+from unittest.mock import Mock
+from PIL import Image
+from backend.services import orchestrator
+from backend.services.orchestrator import ChartAnalysisOrchestrator
+from backend.config import ENABLE_CACHING
+from tests.test_response_builder import SAMPLE_VISION_OUTPUT, SAMPLE_REASONING_OUTPUT
+
+
+class TestOrchestratorCaching:
+    """Test suite for the orchestrator's LRU caches"""
+    
+    @pytest.fixture(scope="module")
+    def image_bytes(self):
+        """Valid 800x600 chart-sized PNG"""
+        buffer = io.BytesIO()
+        Image.new('RGB', (800, 600), color='white').save(buffer, format='PNG')
+        return buffer.getvalue()
+    
+    def _orchestrator(self, enable_cache):
+        """Orchestrator whose model clients return the sample outputs"""
+        instance = ChartAnalysisOrchestrator(enable_cache=enable_cache)
+        instance.vision_client = Mock()
+        instance.vision_client.query_vision_model.return_value = SAMPLE_VISION_OUTPUT
+        instance.reasoning_client = Mock()
+        instance.reasoning_client.query_text_model.return_value = SAMPLE_REASONING_OUTPUT
+        return instance
+    
+    @pytest.fixture
+    def cached(self):
+        """Orchestrator with caching enabled"""
+        return self._orchestrator(enable_cache=True)
+    
+    def test_cache_hit_returns_stored_result(self, cached, image_bytes):
+        """Test a repeated image and context is served from the result cache"""
+        first = cached.analyze_chart(image_bytes, {"asset": "BTC"})
+        second = cached.analyze_chart(image_bytes, {"asset": "BTC"})
+        
+        assert first.success is True
+        assert second is first
+        assert cached.vision_client.query_vision_model.call_count == 1
+        assert cached.reasoning_client.query_text_model.call_count == 1
+    
+    def test_cache_miss_on_different_context(self, cached, image_bytes):
+        """Test a different context is analyzed again"""
+        first = cached.analyze_chart(image_bytes, {"asset": "BTC"})
+        second = cached.analyze_chart(image_bytes, {"asset": "ETH"})
+        
+        assert second is not first
+        assert cached.vision_client.query_vision_model.call_count == 2
+    
+    def test_vision_stage_reused_after_reasoning_failure(self, cached, image_bytes):
+        """Test a retry after a failed reasoning call skips the vision call"""
+        cached.reasoning_client.query_text_model.side_effect = [RuntimeError("timeout"), SAMPLE_REASONING_OUTPUT]
+        
+        failed = cached.analyze_chart(image_bytes, {"asset": "BTC"})
+        retried = cached.analyze_chart(image_bytes, {"asset": "BTC"})
+        
+        assert failed.success is False
+        assert retried.success is True
+        assert cached.vision_client.query_vision_model.call_count == 1
+        assert cached.reasoning_client.query_text_model.call_count == 2
+    
+    def test_eviction_at_cache_size(self, cached, image_bytes, monkeypatch):
+        """Test the least recently used result is evicted beyond RESPONSE_CACHE_SIZE"""
+        monkeypatch.setattr(orchestrator, "RESPONSE_CACHE_SIZE", 2)
+        
+        btc = cached.analyze_chart(image_bytes, {"asset": "BTC"})
+        eth = cached.analyze_chart(image_bytes, {"asset": "ETH"})
+        assert cached.analyze_chart(image_bytes, {"asset": "BTC"}) is btc  # BTC now most recent
+        cached.analyze_chart(image_bytes, {"asset": "SOL"})  # Evicts ETH
+        
+        assert len(cached._response_cache) == 2
+        assert cached.analyze_chart(image_bytes, {"asset": "BTC"}) is btc
+        assert cached.analyze_chart(image_bytes, {"asset": "ETH"}) is not eth
+    
+    def test_caching_disabled_bypasses_caches(self, image_bytes):
+        """Test enable_cache=False analyzes every call and stores nothing"""
+        uncached = self._orchestrator(enable_cache=False)
+        
+        first = uncached.analyze_chart(image_bytes, {"asset": "BTC"})
+        second = uncached.analyze_chart(image_bytes, {"asset": "BTC"})
+        
+        assert second is not first
+        assert uncached.vision_client.query_vision_model.call_count == 2
+        assert uncached.reasoning_client.query_text_model.call_count == 2
+        assert not uncached._response_cache
+        assert not uncached._vision_cache
+        assert not uncached._reasoning_cache
+    
+    def test_caching_defaults_to_config(self):
+        """Test the orchestrator follows ENABLE_CACHING by default"""
+        assert ChartAnalysisOrchestrator().enable_cache is ENABLE_CACHING
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,132 @@
+"""
+Unit Tests for Rate Limiter
+
+Tests sliding windows, blocking, idle sweeping, and resets.
+"""
+
+import threading
+import pytest
+from backend.utils import rate_limiter
+from backend.utils.rate_limiter import RateLimiter, RateLimitConfig
+
+
+class FakeClock:
+    """Controllable stand-in for the limiter's monotonic clock"""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestRateLimiter:
+    """Test suite for RateLimiter"""
+    
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Patch the limiter clock with a controllable one"""
+        clock = FakeClock()
+        monkeypatch.setattr(rate_limiter, "_now", clock)
+        return clock
+    
+    @pytest.fixture
+    def limiter(self, clock):
+        """Limiter allowing 2 requests per 60s, blocking for 300s"""
+        return RateLimiter(RateLimitConfig(max_requests=2, time_window=60, block_duration=300))
+    
+    def test_allows_up_to_limit_then_blocks(self, limiter):
+        """Test requests beyond max_requests are blocked"""
+        assert limiter.is_allowed("user")[0] is True
+        assert limiter.is_allowed("user")[0] is True
+        
+        allowed, reason = limiter.is_allowed("user")
+        
+        assert allowed is False
+        assert "Rate limit exceeded" in reason
+    
+    def test_window_expiry_frees_requests(self, limiter, clock):
+        """Test requests older than the window no longer count"""
+        limiter.is_allowed("user")
+        clock.now += 30
+        limiter.is_allowed("user")
+        
+        clock.now += 31  # First request is now outside the window
+        
+        assert limiter.get_remaining_requests("user") == 1
+        assert limiter.is_allowed("user")[0] is True
+    
+    def test_block_expires_after_block_duration(self, limiter, clock):
+        """Test a blocked identifier is allowed again once the block ends"""
+        for _ in range(3):
+            limiter.is_allowed("user")
+        
+        clock.now += 299
+        assert limiter.is_allowed("user")[0] is False
+        
+        clock.now += 2
+        assert limiter.is_allowed("user")[0] is True
+    
+    def test_remaining_requests_does_not_create_bucket(self, limiter):
+        """Test querying an unseen identifier leaves no state behind"""
+        assert limiter.get_remaining_requests("stranger") == 2
+        assert "stranger" not in limiter.request_log
+    
+    def test_sweep_drops_only_idle_identifiers(self, limiter, clock):
+        """Test sweeping removes idle identifiers but keeps active and blocked ones"""
+        limiter.is_allowed("idle")
+        for _ in range(3):
+            limiter.is_allowed("blocked")
+        clock.now += 61
+        limiter.is_allowed("active")
+        
+        limiter._sweep(clock.now)
+        
+        assert "idle" not in limiter.request_log
+        assert "active" in limiter.request_log
+        assert "blocked" in limiter.blocked_until
+    
+    def test_sweep_runs_every_interval(self, limiter, clock, monkeypatch):
+        """Test is_allowed triggers a sweep every _SWEEP_INTERVAL calls"""
+        monkeypatch.setattr(rate_limiter, "_SWEEP_INTERVAL", 2)
+        limiter.is_allowed("idle")
+        clock.now += 61
+        
+        limiter.is_allowed("active")  # Second call sweeps "idle" out
+        
+        assert "idle" not in limiter.request_log
+    
+    def test_reset_identifier(self, limiter):
+        """Test resetting one identifier leaves the others untouched"""
+        for _ in range(3):
+            limiter.is_allowed("user")
+        limiter.is_allowed("other")
+        
+        limiter.reset("user")
+        
+        assert limiter.is_allowed("user")[0] is True
+        assert limiter.get_remaining_requests("other") == 1
+    
+    def test_reset_all_waits_for_stripe_locks(self, limiter):
+        """Test a full reset does not clear state while a check holds a stripe"""
+        limiter.is_allowed("user")
+        lock = limiter._lock_for("user")
+        lock.acquire()
+        try:
+            resetter = threading.Thread(target=limiter.reset)
+            resetter.start()
+            resetter.join(timeout=0.1)
+            
+            assert resetter.is_alive()
+            assert "user" in limiter.request_log
+        finally:
+            lock.release()
+        resetter.join(timeout=1)
+        
+        assert not resetter.is_alive()
+        assert limiter.request_log == {}
+        assert limiter.blocked_until == {}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,135 @@
+"""
+Unit Tests for Regex Engine Selection
+
+Tests RE2/re engine choice, flag translation, and that patterns the parser
+and safety checks actually use match the same text under either engine.
+"""
+
+import logging
+import re
+import pytest
+from backend.utils import regex_engine
+from backend.utils.regex_engine import compile_pattern
+from backend.utils import safety
+from backend.core.response_builder import _section_body_patterns
+
+needs_re2 = pytest.mark.skipif(regex_engine.re2 is None, reason="google-re2 not installed")
+
+
+class TestEngineSelection:
+    """Test which engine compile_pattern picks"""
+    
+    @pytest.mark.parametrize("pattern", [
+        r'a(?=b)',
+        r'a(?!b)',
+        r'(?<=a)b',
+        r'(?<!a)b',
+        r'(a)\1',
+        r'end\Z',
+    ], ids=["lookahead", "negative_lookahead", "lookbehind", "negative_lookbehind", "backreference", "end_of_string"])
+    def test_unsupported_constructs_fall_back_to_re(self, pattern):
+        """Test patterns RE2 cannot run are compiled with re"""
+        assert isinstance(compile_pattern(pattern), re.Pattern)
+    
+    @pytest.mark.parametrize("pattern,flags", [
+        (r'buy\s+now', 0),
+        (r'\d+', 0),
+        (r'\w+', 0),
+        (r'\bwill\b', 0),
+        (r'[^\S\n]', 0),
+        (r'end$', 0),
+    ], ids=["whitespace", "digit", "word", "word_boundary", "negated_class", "dollar"])
+    def test_divergent_constructs_fall_back_to_re(self, pattern, flags):
+        """Test patterns RE2 would match differently are compiled with re"""
+        assert isinstance(compile_pattern(pattern, flags), re.Pattern)
+    
+    @needs_re2
+    @pytest.mark.parametrize("pattern,flags", [
+        (r'[0-9]+\.[0-9]*', 0),
+        (r'^rsi: (.*)$', re.MULTILINE),
+        (r'cost \$5', 0),
+    ], ids=["plain", "multiline_dollar", "escaped_dollar"])
+    def test_equivalent_pattern_uses_re2(self, pattern, flags):
+        """Test patterns RE2 matches exactly as re are compiled with RE2 when it is installed"""
+        assert not isinstance(compile_pattern(pattern, flags), re.Pattern)
+    
+    def test_without_re2_uses_re(self, monkeypatch):
+        """Test everything compiles with re when RE2 is not installed"""
+        monkeypatch.setattr(regex_engine, "re2", None)
+        
+        assert isinstance(compile_pattern(r'\d+'), re.Pattern)
+    
+    @needs_re2
+    def test_re2_compile_error_falls_back_and_logs(self, caplog):
+        """Test a pattern RE2 rejects at compile time falls back to re with a debug log"""
+        with caplog.at_level(logging.DEBUG, logger=regex_engine.__name__):
+            compiled = compile_pattern(r'(?P<word>a)(?P=word)')
+        
+        assert isinstance(compiled, re.Pattern)
+        assert "RE2 rejected pattern" in caplog.text
+
+
+class TestInlineFlags:
+    """Test re flags are translated to RE2 inline flags"""
+    
+    @pytest.mark.parametrize("pattern,flags,text,expected", [
+        (r'chart', re.IGNORECASE, "CHART", "CHART"),
+        (r'^rsi', re.MULTILINE, "macd\nrsi", "rsi"),
+        (r'a.b', re.DOTALL, "a\nb", "a\nb"),
+        (r'^a.b', re.IGNORECASE | re.MULTILINE | re.DOTALL, "x\nA\nB", "A\nB"),
+        (r'a.b', 0, "a\nb", None),
+    ], ids=["ignorecase", "multiline", "dotall", "combined", "none"])
+    def test_flags_match_like_re(self, pattern, flags, text, expected):
+        """Test each flag combination matches exactly as re does"""
+        match = compile_pattern(pattern, flags).search(text)
+        
+        assert (match.group(0) if match else None) == expected
+        assert bool(re.compile(pattern, flags).search(text)) == (expected is not None)
+
+
+class TestEngineAgreement:
+    """Test compile_pattern matches exactly as re does, with or without RE2"""
+    
+    def test_dollar_matches_before_trailing_newline(self):
+        """Test $ matches before a trailing newline, as in re"""
+        assert compile_pattern(r'x$').search("x\n")
+    
+    @pytest.mark.parametrize("text", [
+        "Risk Considerations:\nWhipsaw risk near resistance\n",
+        "Risk Considerations:\nWhipsaw risk near resistance",
+        "Risk Considerations: Whipsaw risk\n\n## 8. Next\n",
+        "**Risk Considerations**\n- Divergence may fail\n",
+    ])
+    def test_section_body_captures_agree_with_re(self, text):
+        """Test the $-terminated section body patterns capture the same body as re"""
+        for compiled in _section_body_patterns(r'(?:\*\*)?Risk Considerations?(?:\*\*)?'):
+            reference = re.compile(compiled.pattern, compiled.flags)
+            match, re_match = compiled.search(text), reference.search(text)
+            
+            assert bool(match) == bool(re_match)
+            if re_match:
+                assert match.group(1) == re_match.group(1)
+    
+    @pytest.mark.parametrize("text", [
+        "éwill rise",
+        "Buy\xa0now",
+        "no\xa0risk trade",
+        "This is a\xa0buy",
+        "stop loss at\u2009$100",
+        "Target: \u0663\u0664",
+        "Price will definitely rise; swill and willow stay.",
+    ], ids=["accented_prefix", "nbsp", "nbsp_risk", "nbsp_buy", "thin_space", "arabic_indic_digits", "ascii"])
+    def test_safety_patterns_agree_with_re_on_unicode_text(self, text):
+        """Test the guardrail patterns find the same matches as re on non-ASCII text"""
+        patterns = (safety.FINANCIAL_ADVICE_PATTERNS + safety.TRADE_INSTRUCTION_PATTERNS
+                    + safety.PRICE_PREDICTION_PATTERNS + safety.GUARANTEED_OUTCOME_PATTERNS)
+        for pattern in patterns:
+            assert [m.group(0) for m in compile_pattern(pattern, re.IGNORECASE).finditer(text)] == \
+                [m.group(0) for m in re.finditer(pattern, text, re.IGNORECASE)]
+        sanitize = safety._SANITIZE_RE.pattern
+        assert [m.group(0) for m in compile_pattern(sanitize).finditer(text)] == \
+            [m.group(0) for m in re.finditer(sanitize, text)]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
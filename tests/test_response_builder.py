@@ -5,6 +5,7 @@ Tests parsing logic for vision and reasoning outputs.
 """
 
 import pytest
+from backend.utils import regex_engine
 from backend.core.response_builder import (
     ResponseParser,
     VisionAnalysis,
@@ -14,18 +15,7 @@ from backend.core.response_builder import (
 )
 
 
-class TestResponseParser:
-    """Test suite for ResponseParser"""
-    
-    @pytest.fixture
-    def parser(self):
-        """Create parser instance"""
-        return ResponseParser()
-    
-    @pytest.fixture
-    def sample_vision_output(self):
-        """Sample vision model output"""
-        return """
+SAMPLE_VISION_OUTPUT = """
 Chart Type: Candlestick chart, 4-hour timeframe
 
 Price Structure:
@@ -48,11 +38,8 @@ Momentum Signals:
 - RSI showing bearish divergence
 - MACD histogram declining
 """
-    
-    @pytest.fixture
-    def sample_reasoning_output(self):
-        """Sample reasoning model output"""
-        return """
+
+SAMPLE_REASONING_OUTPUT = """
 ## 1. Market Structure Assessment
 
 The chart displays an intact uptrend structure. Price is testing resistance.
@@ -124,6 +111,39 @@ What to Monitor:
 - Volume behavior
 - EMA 20 support
 """
+
+
+class TestResponseParser:
+    """Test suite for ResponseParser"""
+    
+    @pytest.fixture(scope="module")
+    def parser(self):
+        """Create parser instance"""
+        return ResponseParser()
+    
+    @pytest.fixture(scope="module")
+    def sample_vision_output(self):
+        """Sample vision model output"""
+        return SAMPLE_VISION_OUTPUT
+    
+    @pytest.fixture(scope="module")
+    def sample_reasoning_output(self):
+        """Sample reasoning model output"""
+        return SAMPLE_REASONING_OUTPUT
+    
+    @pytest.fixture(scope="module")
+    def parsed_reasoning(self, parser, sample_reasoning_output):
+        """Sample reasoning output parsed once for the read-only reasoning tests"""
+        return parser.parse_reasoning_output(sample_reasoning_output)
+    
+    @pytest.fixture(scope="module")
+    def parsed_complete(self, sample_vision_output, sample_reasoning_output):
+        """Sample outputs parsed once into a CompleteAnalysis"""
+        return parse_complete_analysis(
+            sample_vision_output,
+            sample_reasoning_output,
+            metadata={"test": "data"}
+        )
     
     def test_parse_vision_output(self, parser, sample_vision_output):
         """Test vision output parsing"""
@@ -144,63 +164,46 @@ What to Monitor:
         assert result.chart_type == "Line chart"
         assert result.indicators_detected == []
     
-    def test_parse_reasoning_output(self, parser, sample_reasoning_output):
+    def test_parse_reasoning_output(self, parsed_reasoning):
         """Test reasoning output parsing"""
-        result = parser.parse_reasoning_output(sample_reasoning_output)
-        
-        assert isinstance(result, ReasoningAnalysis)
-        assert result.market_structure.trend_description
-        assert result.regime.regime
-        assert result.strategy_bias.bias
-        assert len(result.suitable_approaches.approaches) > 0
+        assert isinstance(parsed_reasoning, ReasoningAnalysis)
+        assert parsed_reasoning.market_structure.trend_description
+        assert parsed_reasoning.regime.regime
+        assert parsed_reasoning.strategy_bias.bias
+        assert len(parsed_reasoning.suitable_approaches.approaches) > 0
     
-    def test_parse_market_structure(self, parser, sample_reasoning_output):
+    def test_parse_market_structure(self, parsed_reasoning):
         """Test market structure parsing"""
-        result = parser.parse_reasoning_output(sample_reasoning_output)
-        
-        assert "uptrend" in result.market_structure.trend_description.lower()
-        assert len(result.market_structure.key_levels) > 0
+        assert "uptrend" in parsed_reasoning.market_structure.trend_description.lower()
+        assert len(parsed_reasoning.market_structure.key_levels) > 0
     
-    def test_parse_momentum(self, parser, sample_reasoning_output):
+    def test_parse_momentum(self, parsed_reasoning):
         """Test momentum parsing"""
-        result = parser.parse_reasoning_output(sample_reasoning_output)
-        
-        assert result.momentum.assessment
-        assert len(result.momentum.indicators) > 0
+        assert parsed_reasoning.momentum.assessment
+        assert len(parsed_reasoning.momentum.indicators) > 0
     
-    def test_parse_strategy_bias(self, parser, sample_reasoning_output):
+    def test_parse_strategy_bias(self, parsed_reasoning):
         """Test strategy bias parsing"""
-        result = parser.parse_reasoning_output(sample_reasoning_output)
-        
-        assert "Neutral" in result.strategy_bias.bias or "Bearish" in result.strategy_bias.bias
-        assert result.strategy_bias.confidence in ["High", "Medium", "Low"]
-        assert len(result.strategy_bias.reasoning) > 0
+        assert "Neutral" in parsed_reasoning.strategy_bias.bias or "Bearish" in parsed_reasoning.strategy_bias.bias
+        assert parsed_reasoning.strategy_bias.confidence in ["High", "Medium", "Low"]
+        assert len(parsed_reasoning.strategy_bias.reasoning) > 0
     
-    def test_parse_invalidation(self, parser, sample_reasoning_output):
+    def test_parse_invalidation(self, parsed_reasoning):
         """Test invalidation conditions parsing"""
-        result = parser.parse_reasoning_output(sample_reasoning_output)
-        
-        assert len(result.invalidation.bullish_invalidation) > 0
-        assert len(result.invalidation.bearish_invalidation) > 0
-        assert len(result.invalidation.key_levels) > 0
+        assert len(parsed_reasoning.invalidation.bullish_invalidation) > 0
+        assert len(parsed_reasoning.invalidation.bearish_invalidation) > 0
+        assert len(parsed_reasoning.invalidation.key_levels) > 0
     
-    def test_parse_complete_analysis(self, sample_vision_output, sample_reasoning_output):
+    def test_parse_complete_analysis(self, parsed_complete):
         """Test complete analysis parsing"""
-        result = parse_complete_analysis(
-            sample_vision_output,
-            sample_reasoning_output,
-            metadata={"test": "data"}
-        )
-        
-        assert isinstance(result, CompleteAnalysis)
-        assert isinstance(result.vision, VisionAnalysis)
-        assert isinstance(result.reasoning, ReasoningAnalysis)
-        assert result.metadata["test"] == "data"
+        assert isinstance(parsed_complete, CompleteAnalysis)
+        assert isinstance(parsed_complete.vision, VisionAnalysis)
+        assert isinstance(parsed_complete.reasoning, ReasoningAnalysis)
+        assert parsed_complete.metadata["test"] == "data"
     
-    def test_to_streamlit_format(self, parser, sample_vision_output, sample_reasoning_output):
+    def test_to_streamlit_format(self, parser, parsed_complete):
         """Test Streamlit format conversion"""
-        analysis = parse_complete_analysis(sample_vision_output, sample_reasoning_output)
-        result = parser.to_streamlit_format(analysis)
+        result = parser.to_streamlit_format(parsed_complete)
         
         assert "vision" in result
         assert "analysis" in result
@@ -220,6 +223,50 @@ What to Monitor:
         assert isinstance(vision_result, VisionAnalysis)
         assert isinstance(reasoning_result, ReasoningAnalysis)
     
+    def test_fields_trimmed_after_unicode_whitespace(self, parser):
+        """Test NBSP after a field label does not end up in the value"""
+        vision = parser.parse_vision_output("Chart Type:\xa0Candlestick\nTimeframe:\u20094H")
+        section = "Signal: BUY on confirmation\nEntry:\xa01.0850\nStop Loss:\xa01.0800\nTarget 1:\xa01.0950\n"
+        
+        signals = parser._parse_trading_signals(section, section.lower(), section)
+        
+        assert vision.chart_type == "Candlestick"
+        assert vision.timeframe == "4H"
+        assert signals.entry_level == "1.0850"
+        assert signals.stop_loss == "1.0800"
+        assert signals.take_profit_1 == "1.0950"
+    
+    @pytest.mark.skipif(regex_engine.re2 is None, reason="google-re2 not installed")
+    def test_extract_field_strips_re2_capture(self, parser):
+        """Test values are stripped even when the engine's \\s leaves NBSP in the capture"""
+        pattern = regex_engine.re2.compile(r'(?i)Entry:?\s*(.+)')
+        
+        assert parser._extract_field("Entry:\xa01.0850", pattern) == "1.0850"
+    
+    def test_sections_found_after_length_changing_lowercase(self, parser, parsed_reasoning, sample_reasoning_output):
+        """Test sections still parse when lower() lengthens text before the headers"""
+        # 'İ'.lower() is two characters, shifting every lowercased offset
+        result = parser.parse_reasoning_output("İ" * 40 + "\n" + sample_reasoning_output)
+        
+        assert result.market_structure == parsed_reasoning.market_structure
+        assert result.momentum == parsed_reasoning.momentum
+        assert result.strategy_bias == parsed_reasoning.strategy_bias
+    
+    def test_keyword_fallback_after_length_changing_lowercase(self, parser):
+        """Test keyword context windows map onto the original text after 'İ'"""
+        text = "İ" * 300 + " The market is trending higher, a clean bullish structure."
+        
+        result = parser.parse_reasoning_output(text)
+        
+        assert result.regime.regime == "Trending Bullish"
+    
+    def test_repeated_output_uses_cache(self, parser, sample_reasoning_output):
+        """Test identical outputs are parsed once and shared"""
+        first = parser.parse_reasoning_output(sample_reasoning_output)
+        second = ResponseParser().parse_reasoning_output(sample_reasoning_output)
+        
+        assert first is second
+    
     def test_extract_list_items(self, parser):
         """Test list item extraction"""
         text = """
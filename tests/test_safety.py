@@ -4,7 +4,11 @@ Unit Tests for Safety Validator
 Tests safety checks, disclaimer injection, and output sanitization.
 """
 
+import importlib.util
+import sys
+from pathlib import Path
 import pytest
+from backend.utils import regex_engine
 from backend.utils.safety import (
     SafetyValidator,
     SafeFailureHandler,
@@ -16,11 +20,13 @@ from backend.utils.safety import (
     SHORT_DISCLAIMER
 )
 
+SAFETY_PATH = Path(__file__).resolve().parent.parent / "backend" / "utils" / "safety.py"
+
 
 class TestSafetyValidator:
     """Test suite for SafetyValidator"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def validator(self):
         """Create validator instance"""
         return SafetyValidator(strict_mode=True)
@@ -39,49 +45,20 @@ class TestSafetyValidator:
         assert ViolationType.FINANCIAL_ADVICE not in result.violations
         assert ViolationType.TRADE_INSTRUCTION not in result.violations
     
-    def test_financial_advice_detection(self, validator):
-        """Test detection of financial advice"""
-        advice_text = "You should buy this stock now"
-        
-        result = validator.validate_output(advice_text, confidence="High")
-        
-        assert ViolationType.FINANCIAL_ADVICE in result.violations
-        assert result.level == SafetyLevel.BLOCKED
-    
-    def test_trade_instruction_detection(self, validator):
-        """Test detection of trade instructions"""
-        instruction_text = "Enter at $50,000 with stop loss at $48,000"
-        
-        result = validator.validate_output(instruction_text, confidence="High")
-        
-        assert ViolationType.TRADE_INSTRUCTION in result.violations
-        assert result.level == SafetyLevel.BLOCKED
-    
-    def test_price_prediction_detection(self, validator):
-        """Test detection of price predictions"""
-        prediction_text = "Price will reach $60,000 by next week"
-        
-        result = validator.validate_output(prediction_text, confidence="High")
-        
-        assert ViolationType.PRICE_PREDICTION in result.violations
-    
-    def test_guaranteed_outcome_detection(self, validator):
-        """Test detection of guaranteed outcomes"""
-        guarantee_text = "This setup is guaranteed to work 100%"
-        
-        result = validator.validate_output(guarantee_text, confidence="High")
-        
-        assert ViolationType.GUARANTEED_OUTCOME in result.violations
-        assert result.level == SafetyLevel.BLOCKED
-    
-    def test_low_confidence_blocking(self, validator):
-        """Test that low confidence outputs are blocked"""
-        low_conf_text = "The chart is unclear"
-        
-        result = validator.validate_output(low_conf_text, confidence="Low")
-        
-        assert ViolationType.LOW_CONFIDENCE in result.violations
-        assert result.level == SafetyLevel.BLOCKED
+    @pytest.mark.parametrize("text,confidence,expected_violation,expected_level", [
+        ("You should buy this stock now", "High", ViolationType.FINANCIAL_ADVICE, SafetyLevel.BLOCKED),
+        ("Enter at $50,000 with stop loss at $48,000", "High", ViolationType.TRADE_INSTRUCTION, SafetyLevel.BLOCKED),
+        ("Price will reach $60,000 by next week", "High", ViolationType.PRICE_PREDICTION, None),
+        ("This setup is guaranteed to work 100%", "High", ViolationType.GUARANTEED_OUTCOME, SafetyLevel.BLOCKED),
+        ("The chart is unclear", "Low", ViolationType.LOW_CONFIDENCE, SafetyLevel.BLOCKED),
+    ], ids=["financial_advice", "trade_instruction", "price_prediction", "guaranteed_outcome", "low_confidence"])
+    def test_violation_detection(self, validator, text, confidence, expected_violation, expected_level):
+        """Test each violation type is detected (and blocked where expected)"""
+        result = validator.validate_output(text, confidence=confidence)
+        
+        assert expected_violation in result.violations
+        if expected_level is not None:
+            assert result.level == expected_level
     
     def test_disclaimer_injection(self, validator):
         """Test that disclaimer is injected when missing"""
@@ -90,7 +67,8 @@ class TestSafetyValidator:
         result = validator.validate_output(text_without_disclaimer, confidence="Medium")
         
         assert result.modified_output is not None
-        assert "disclaimer" in result.modified_output.lower() or "not financial advice" in result.modified_output.lower()
+        output_lower = result.modified_output.lower()
+        assert "disclaimer" in output_lower or "not financial advice" in output_lower
     
     def test_existing_disclaimer_detection(self, validator):
         """Test that existing disclaimers are detected"""
@@ -118,14 +96,24 @@ class TestSafetyValidator:
         
         assert score < 0.5
     
+    def test_confidence_counts_terms_in_contractions(self, validator):
+        """Test hedge words inside contractions and quotes are counted"""
+        text = "Price could've bounced and might've stalled, as 'may' suggests."
+        
+        score = validator._assess_confidence(text, "Medium")
+        
+        # Four terms lift the medium base score, as the uncontracted wording does
+        assert score == validator._assess_confidence("Price could bounce and might stall, as may suggests.", "Medium")
+        assert score > 0.5
+    
     def test_sanitize_output(self, validator):
         """Test output sanitization"""
         unsafe_text = "Price will definitely break resistance"
         
-        sanitized = validator.sanitize_output(unsafe_text)
+        sanitized = validator.sanitize_output(unsafe_text).lower()
         
-        assert "will" not in sanitized.lower() or "may" in sanitized.lower()
-        assert "definitely" not in sanitized.lower()
+        assert "will" not in sanitized or "may" in sanitized
+        assert "definitely" not in sanitized
     
     def test_non_strict_mode(self):
         """Test non-strict mode allows warnings"""
@@ -139,31 +127,66 @@ class TestSafetyValidator:
         assert len(result.warnings) > 0
 
 
+class TestUnicodeInput:
+    """Test the guardrails on non-ASCII whitespace and digits, with and without RE2"""
+    
+    @pytest.fixture(params=["re2", "re"])
+    def safety_module(self, request, monkeypatch):
+        """Fresh copy of the safety module built with RE2 installed or absent"""
+        if request.param == "re2" and regex_engine.re2 is None:
+            pytest.skip("google-re2 not installed")
+        if request.param == "re":
+            monkeypatch.setitem(sys.modules, "re2", None)
+            monkeypatch.setattr(regex_engine, "re2", None)
+        spec = importlib.util.spec_from_file_location(f"safety_with_{request.param}", SAFETY_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    
+    @pytest.mark.parametrize("text,expected_violation", [
+        ("Buy\xa0now", "financial_advice"),
+        ("no\xa0risk trade", "guaranteed_outcome"),
+        ("This is a\xa0buy", "financial_advice"),
+        ("stop loss at\u2009$100", "trade_instruction"),
+        ("Target: \u0663\u0664", "trade_instruction"),
+    ], ids=["nbsp_buy_now", "nbsp_no_risk", "nbsp_this_is_a_buy", "thin_space_stop_loss", "arabic_indic_target"])
+    def test_unicode_separators_are_blocked(self, safety_module, text, expected_violation):
+        """Test NBSP, thin space and non-ASCII digits do not slip past the checks"""
+        result = safety_module.SafetyValidator(strict_mode=True).validate_output(text, confidence="Medium")
+        
+        assert expected_violation in [violation.value for violation in result.violations]
+        assert result.level.value == "blocked"
+    
+    def test_sanitize_after_nbsp(self, safety_module):
+        """Test definitive words after an NBSP are still softened"""
+        sanitized = safety_module.SafetyValidator().sanitize_output("Price\xa0will\xa0definitely rise")
+        
+        assert sanitized == "Price\xa0may\xa0potentially rise"
+
+
 class TestSafeFailureHandler:
     """Test suite for SafeFailureHandler"""
     
-    def test_low_confidence_message(self):
-        """Test low confidence message generation"""
-        message = SafeFailureHandler.get_low_confidence_message()
-        
-        assert "Analysis Unavailable" in message
-        assert "confidence threshold" in message.lower()
-    
-    def test_error_message(self):
-        """Test error message generation"""
-        message = SafeFailureHandler.get_error_message()
-        
-        assert "Error" in message
-        assert "try again" in message.lower()
-    
-    def test_blocked_message(self):
-        """Test blocked message generation"""
-        violations = [ViolationType.FINANCIAL_ADVICE, ViolationType.TRADE_INSTRUCTION]
-        message = SafeFailureHandler.get_blocked_message(violations)
-        
-        assert "Blocked" in message
-        assert "Financial Advice" in message
-        assert "Trade Instruction" in message
+    @pytest.mark.parametrize("get_message,expected,expected_lower", [
+        (SafeFailureHandler.get_low_confidence_message, ["Analysis Unavailable"], ["confidence threshold"]),
+        (SafeFailureHandler.get_error_message, ["Error"], ["try again"]),
+        (
+            lambda: SafeFailureHandler.get_blocked_message(
+                [ViolationType.FINANCIAL_ADVICE, ViolationType.TRADE_INSTRUCTION]
+            ),
+            ["Blocked", "Financial Advice", "Trade Instruction"],
+            [],
+        ),
+    ], ids=["low_confidence", "error", "blocked"])
+    def test_failure_messages(self, get_message, expected, expected_lower):
+        """Test each failure message carries its key phrases"""
+        message = get_message()
+        
+        for phrase in expected:
+            assert phrase in message
+        message_lower = message.lower()
+        for phrase in expected_lower:
+            assert phrase in message_lower
 
 
 class TestConvenienceFunctions:
@@ -188,23 +211,18 @@ class TestConvenienceFunctions:
         assert "Blocked" in output
         assert len(warnings) > 0
     
-    def test_inject_disclaimer_top(self):
-        """Test disclaimer injection at top"""
-        text = "This is analysis text"
-        
-        result = inject_disclaimer(text, position='top')
-        
-        assert SHORT_DISCLAIMER in result
-        assert text in result
-    
-    def test_inject_disclaimer_both(self):
-        """Test disclaimer injection at both positions"""
+    @pytest.mark.parametrize("position,disclaimers", [
+        ('top', [SHORT_DISCLAIMER]),
+        ('both', [SHORT_DISCLAIMER, MANDATORY_DISCLAIMER]),
+    ], ids=["top", "both"])
+    def test_inject_disclaimer(self, position, disclaimers):
+        """Test disclaimer injection at each position"""
         text = "This is analysis text"
         
-        result = inject_disclaimer(text, position='both')
+        result = inject_disclaimer(text, position=position)
         
-        assert SHORT_DISCLAIMER in result
-        assert MANDATORY_DISCLAIMER in result
+        for disclaimer in disclaimers:
+            assert disclaimer in result
         assert text in result
 
 